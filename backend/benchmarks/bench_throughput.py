@@ -0,0 +1,58 @@
+"""
+HTTP 吞吐量基准测试（对比开发服务器与 gunicorn）
+
+用法：先启动被测服务，再运行
+    python benchmarks/bench_throughput.py --url http://127.0.0.1:5000/api/words --concurrency 16 --duration 10
+
+输出请求数、吞吐量（req/s）、p50/p99 延迟和错误数。
+"""
+import argparse
+import threading
+import time
+import urllib.error
+import urllib.request
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--url', default='http://127.0.0.1:5000/api/words')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10.0)
+    args = parser.parse_args()
+
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    def worker():
+        local, failed = [], 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(args.url, timeout=30) as response:
+                    response.read()
+                local.append(time.perf_counter() - start)
+            except (urllib.error.URLError, OSError):
+                failed += 1
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=worker) for _ in range(args.concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    count = len(latencies)
+    p50 = latencies[count // 2] * 1000 if count else 0
+    p99 = latencies[min(count - 1, int(count * 0.99))] * 1000 if count else 0
+    print(f'requests={count} errors={errors[0]} rps={count / elapsed:.1f} p50={p50:.1f}ms p99={p99:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
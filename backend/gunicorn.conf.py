@@ -0,0 +1,50 @@
+"""
+gunicorn 生产环境配置
+
+所有参数都可以通过环境变量覆盖，例如：
+    GUNICORN_WORKERS=4 GUNICORN_WORKER_CONNECTIONS=2000 gunicorn -c gunicorn.conf.py wsgi:app
+"""
+import multiprocessing
+import os
+
+# 监听地址
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+# 进程 / 并发模型：默认 (2 x CPU + 1) 个进程，gevent 协程处理并发
+# /api/events 是长连接，gthread 下每个连接会一直占用一个线程；gevent 下只占用一个协程
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gevent')
+# 仅 gthread 使用：每个进程的线程数
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+# gevent worker 下每个进程可同时保持的连接数（/api/events 长连接只占用一个协程）
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '1000'))
+
+# 预加载应用：主进程导入一次后 fork，节省内存和启动时间
+preload_app = os.getenv('GUNICORN_PRELOAD', '1') == '1'
+
+# 超时：请求超时、优雅退出等待时间、keep-alive
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '5'))
+
+# 定期重启 worker，防止内存缓慢增长
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '2000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '200'))
+
+# 日志输出到标准输出，由 docker 收集
+accesslog = os.getenv('GUNICORN_ACCESSLOG', '-')
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOGLEVEL', 'info')
+
+
+def post_fork(server, worker):
+    """fork 之后丢弃从主进程继承的数据库连接，每个 worker 使用自己的连接池"""
+    from app import app, db
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+
+def post_worker_init(worker):
+    """worker 初始化完成后（gevent 已完成 monkey patch）再创建 SSE 分发器的锁，确保是协程锁"""
+    from app import event_broker
+    event_broker.reset()
@@ -0,0 +1,28 @@
+import pytest
+
+
+@pytest.mark.parametrize('url', ['/api/words', '/api/books', '/api/poems', '/api/reward-items', '/api/travel-plans'])
+def test_unchanged_list_returns_304_for_strong_and_weak_tags(client, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+    # nginx 对压缩后的响应把 ETag 弱化为 W/"..."，浏览器会原样带回
+    assert client.get(url, headers={'If-None-Match': f'W/{etag}'}).status_code == 304
+
+
+def test_write_changes_etag(client):
+    etag = client.get('/api/words').headers['ETag']
+    assert client.post('/api/words', json={'word': '森', 'pinyin': 'sēn'}).status_code == 201
+
+    response = client.get('/api/words', headers={'If-None-Match': f'W/{etag}'})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_failed_write_keeps_etag(client):
+    etag = client.get('/api/words').headers['ETag']
+    assert client.post('/api/words', json={}).status_code == 400
+    assert client.get('/api/words', headers={'If-None-Match': etag}).status_code == 304
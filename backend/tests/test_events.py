@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from app import ActivityEvent, event_broker
+
+
+@pytest.fixture
+def events_client(app, client, monkeypatch):
+    monkeypatch.setitem(app.config, 'EVENTS_POLL_INTERVAL', 0.05)
+    # 前一个用例的轮询线程在没有订阅者后自行退出，等它结束后再从干净的状态开始
+    if event_broker.thread is not None:
+        event_broker.thread.join(timeout=5)
+    event_broker.reset()
+    return client
+
+
+def read_messages(stream, count):
+    messages = []
+    while len(messages) < count:
+        chunk = next(stream).decode('utf-8')
+        if chunk.startswith('data:') or chunk.startswith('id:'):
+            lines = dict(line.split(': ', 1) for line in chunk.strip().split('\n'))
+            messages.append((int(lines['id']) if 'id' in lines else None, json.loads(lines['data'])))
+    return messages
+
+
+def test_reconnect_replays_missed_events_then_streams_live(app, events_client):
+    client = events_client
+    for word_id in (1, 2, 3):
+        client.post(f'/api/learn/{word_id}')
+    with app.app_context():
+        event_ids = [row.id for row in ActivityEvent.query.order_by(ActivityEvent.id)]
+
+    response = client.get('/api/events', headers={'Last-Event-ID': str(event_ids[0])}, buffered=False)
+    stream = iter(response.response)
+    try:
+        assert next(stream).decode('utf-8').startswith('retry:')
+        snapshot, *backlog = read_messages(stream, 3)
+        assert snapshot == (None, {'type': 'stars', 'stars': 3})
+        assert [event_id for event_id, _ in backlog] == event_ids[1:]
+        assert all(data['type'] == 'learn' for _, data in backlog)
+
+        client.post('/api/learn/4')
+        [(event_id, data)] = read_messages(stream, 1)
+        assert event_id > event_ids[-1]
+        assert (data['type'], data['stars']) == ('learn', 4)
+    finally:
+        response.close()
@@ -0,0 +1,72 @@
+import gzip
+import json
+
+from app import export_lines
+
+
+def export_records(data):
+    lines = [json.loads(line) for line in data.decode('utf-8').splitlines()]
+    tables, current = {}, None
+    for line in lines[1:]:
+        if isinstance(line, dict):
+            current = tables.setdefault(line['table'], {'columns': line['columns'], 'rows': []})
+        else:
+            current['rows'].append(line)
+    return lines[0], tables
+
+
+def test_export_includes_sentence_templates(client):
+    client.post('/api/sentences', json={'sentence': '音乐会'})
+    response = client.get('/api/export')
+    assert response.status_code == 200
+
+    info, tables = export_records(response.get_data())
+    assert 'sentence_templates' in info['tables']
+    templates = tables['sentence_templates']
+    sentence_index = templates['columns'].index('sentence')
+    assert '音乐会' in [row[sentence_index] for row in templates['rows']]
+    for derived in ('sentence_chars', 'poem_terms', 'activity_events', 'data_versions'):
+        assert derived not in tables
+
+
+def test_gzip_export_matches_plain_export(client):
+    plain = client.get('/api/export').get_data()
+    compressed = client.get('/api/export', query_string={'gzip': 1})
+    assert compressed.headers['Content-Type'] == 'application/gzip'
+    assert export_records(gzip.decompress(compressed.get_data()))[1] == export_records(plain)[1]
+
+
+def is_table_header(chunk, name):
+    line = json.loads(chunk.splitlines()[0])
+    return isinstance(line, dict) and line.get('table') == name
+
+
+def column_values(table, column):
+    index = table['columns'].index(column)
+    return [row[index] for row in table['rows']]
+
+
+def test_export_is_one_snapshot_across_tables(app, client):
+    plan_id = client.post('/api/travel-plans', json={'destination': '杭州', 'budget': 500}).get_json()['id']
+    client.post(f'/api/travel-plans/{plan_id}/footprints', json={'expense': 100})
+    client.post('/api/learn/1')
+
+    with app.app_context():
+        chunks = export_lines()
+        data = []
+        # 读完旅行计划、还没读足迹时，另一个请求写入新足迹（同时累加计划花费）并学习新字
+        for chunk in chunks:
+            data.append(chunk)
+            if is_table_header(chunk, 'travel_footprints'):
+                break
+        assert client.post(f'/api/travel-plans/{plan_id}/footprints', json={'expense': 50}).status_code == 201
+        assert client.post('/api/learn/2').status_code == 200
+        data.extend(chunks)
+
+    _, tables = export_records(''.join(data).encode('utf-8'))
+    plans = tables['travel_plans']
+    footprints = tables['travel_footprints']
+    assert column_values(plans, 'total_expense') == [100]
+    assert column_values(plans, 'footprint_count') == [1]
+    assert column_values(footprints, 'expense') == [100]
+    assert len(tables['learning_records']['rows']) == sum(column_values(tables['words'], 'learn_count')) == 1
@@ -0,0 +1,57 @@
+def import_words(client, count):
+    text = ''.join(f'字{i},zi{i}\n' for i in range(count))
+    response = client.post('/api/words/import?format=csv', data=text.encode('utf-8'), content_type='text/csv')
+    assert response.status_code == 200
+
+
+def walk_pages(client, url, limit, **params):
+    pages, cursor = [], None
+    while True:
+        page = client.get(url, query_string={**params, 'limit': limit, 'cursor': cursor}).get_json()
+        pages.append(page)
+        if not page['hasMore']:
+            assert page['nextCursor'] is None
+            return pages
+        cursor = page['nextCursor']
+
+
+def test_cursor_pages_cover_full_list_in_order(client):
+    # 批量导入的行 created_at 可能相同，靠 id 兜底保证翻页不重不漏
+    import_words(client, 50)
+    full = client.get('/api/words').get_json()
+
+    pages = walk_pages(client, '/api/words', 7)
+    paged = [item for page in pages for item in page['items']]
+    assert [w['id'] for w in paged] == [w['id'] for w in full]
+    assert all(len(page['items']) == 7 for page in pages[:-1])
+
+
+def test_first_page_carries_summary_only(client):
+    import_words(client, 10)
+    pages = walk_pages(client, '/api/words', 5)
+    assert pages[0]['total'] == len(client.get('/api/words').get_json())
+    assert 'learnedTotal' in pages[0]
+    assert all('total' not in page for page in pages[1:])
+
+
+def test_filters_apply_before_paging(client):
+    import_words(client, 20)
+    learned_ids = {w['id'] for w in client.get('/api/words', query_string={'q': '字1'}).get_json()}
+    for word_id in learned_ids:
+        client.post(f'/api/learn/{word_id}')
+
+    pages = walk_pages(client, '/api/words', 3, learned=1)
+    assert {w['id'] for page in pages for w in page['items']} == learned_ids
+
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get('/api/words', query_string={'limit': 5, 'cursor': 'not-a-cursor'})
+    assert response.status_code == 400
+
+
+def test_book_list_uses_same_cursor_contract(client):
+    for index in range(5):
+        assert client.post('/api/books', json={'title': f'Book {index}'}).status_code == 201
+    full = client.get('/api/books').get_json()
+    pages = walk_pages(client, '/api/books', 2)
+    assert [b['id'] for page in pages for b in page['items']] == [b['id'] for b in full]
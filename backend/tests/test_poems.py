@@ -0,0 +1,47 @@
+import pytest
+
+
+def add_poem(client, title, author, content):
+    response = client.post('/api/poems', json={'title': title, 'author': author, 'content': content})
+    assert response.status_code == 201
+    return response.get_json()
+
+
+def search(client, q):
+    return client.get('/api/poems/search', query_string={'q': q}).get_json()['items']
+
+
+@pytest.fixture
+def poems(client):
+    return {
+        'jys': add_poem(client, '静夜思', '李白', '床前明月光，疑是地上霜。举头望明月，低头思故乡。'),
+        'cx': add_poem(client, '春晓', '孟浩然', '春眠不觉晓，处处闻啼鸟。夜来风雨声，花落知多少。'),
+        'wlsp': add_poem(client, '望庐山瀑布', '李白', '日照香炉生紫烟，遥看瀑布挂前川。'),
+    }
+
+
+def test_search_matches_title_author_and_content(client, poems):
+    assert [p['id'] for p in search(client, '春晓')] == [poems['cx']['id']]
+    assert {p['id'] for p in search(client, '李白')} == {poems['jys']['id'], poems['wlsp']['id']}
+    [hit] = search(client, '明月')
+    assert hit['id'] == poems['jys']['id']
+    assert '明月' in hit['snippet'] and hit['highlights']
+
+
+def test_all_keywords_must_match(client, poems):
+    assert [p['id'] for p in search(client, '李白 瀑布')] == [poems['wlsp']['id']]
+    assert search(client, '李白 春眠') == []
+
+
+def test_index_follows_edits_and_deletes(client, poems):
+    poem_id = poems['cx']['id']
+    client.put(f'/api/poems/{poem_id}', json={'content': '白日依山尽，黄河入海流。'})
+    assert search(client, '春眠') == []
+    assert [p['id'] for p in search(client, '黄河')] == [poem_id]
+
+    client.delete(f'/api/poems/{poem_id}')
+    assert search(client, '黄河') == []
+
+
+def test_empty_query_is_rejected(client):
+    assert client.get('/api/poems/search', query_string={'q': '  '}).status_code == 400
@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app import ReadingRecord, db
+
+
+def add_book(client, title, total_pages=100):
+    response = client.post('/api/books', json={'title': title, 'totalPages': total_pages})
+    assert response.status_code == 201
+    return response.get_json()['id']
+
+
+def reading_records(app, book_id):
+    with app.app_context():
+        return ReadingRecord.query.filter_by(book_id=book_id).all()
+
+
+def books_by_id(client, **params):
+    return {book['id']: book for book in client.get('/api/books', query_string=params).get_json()}
+
+
+def test_repeated_reading_writes_share_one_record(app, client):
+    book_id = add_book(client, '小王子', total_pages=120)
+    assert client.post(f'/api/reading/{book_id}/start').status_code == 200
+    started_at = client.post(f'/api/reading/{book_id}/start').get_json()['startedAt']
+    response = client.post(f'/api/reading/{book_id}/progress', json={'currentPage': 40, 'notes': '第五章'})
+    assert response.get_json() == {'message': '进度已更新', 'currentPage': 40, 'isCompleted': False}
+
+    records = reading_records(app, book_id)
+    assert len(records) == 1
+    assert records[0].started_at.isoformat() == started_at
+
+    book = books_by_id(client)[book_id]
+    assert (book['hasRecord'], book['currentPage'], book['isCompleted'], book['notes']) == (True, 40, False, '第五章')
+
+    assert client.post(f'/api/reading/{book_id}/complete').status_code == 200
+    book = books_by_id(client)[book_id]
+    assert (book['currentPage'], book['isCompleted']) == (120, True)
+    assert len(reading_records(app, book_id)) == 1
+
+
+def test_progress_creates_record_and_completes_at_last_page(app, client):
+    book_id = add_book(client, '西游记', total_pages=50)
+    response = client.post(f'/api/reading/{book_id}/progress', json={'currentPage': 50})
+    assert response.get_json()['isCompleted'] is True
+    assert len(reading_records(app, book_id)) == 1
+
+    assert client.post(f'/api/reading/{book_id}/progress', json={}).status_code == 400
+    assert client.post('/api/reading/9999/start').status_code == 404
+
+
+def test_concurrent_starts_share_one_record(app, client):
+    book_id = add_book(client, '三国演义')
+    statuses = []
+
+    def start():
+        statuses.append(app.test_client().post(f'/api/reading/{book_id}/start').status_code)
+
+    threads = [threading.Thread(target=start) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert statuses == [200] * 8
+    assert len(reading_records(app, book_id)) == 1
+
+
+def test_book_id_is_unique_on_reading_records(app, client):
+    book_id = add_book(client, '水浒传')
+    client.post(f'/api/reading/{book_id}/start')
+    with app.app_context():
+        db.session.add(ReadingRecord(book_id=book_id))
+        with pytest.raises(IntegrityError):
+            db.session.commit()
+        db.session.rollback()
+
+
+def test_books_list_and_stats_follow_reading_status(client):
+    unread = add_book(client, '红楼梦')
+    reading = add_book(client, '格林童话')
+    finished = add_book(client, '安徒生童话')
+    client.post(f'/api/reading/{reading}/start')
+    client.post(f'/api/reading/{finished}/complete')
+
+    books = books_by_id(client)
+    assert books[unread]['hasRecord'] is False
+    assert books[unread]['startedAt'] is None
+    assert books[reading]['hasRecord'] is True
+    assert books[finished]['isCompleted'] is True
+
+    assert set(books_by_id(client, completed='true')) == {finished}
+    assert set(books_by_id(client, completed='false')) == set(books) - {finished}
+
+    stats = client.get('/api/reading/stats').get_json()
+    assert stats['totalBooks'] == len(books)
+    assert stats['completedBooks'] == 1
+    assert stats['readingBooks'] == 1
+    assert stats['unreadBooks'] == len(books) - 2
@@ -0,0 +1,94 @@
+from datetime import datetime
+
+from app import StarRedemption, adjust_stars, db
+
+
+def give_stars(app, stars):
+    with app.app_context():
+        adjust_stars(stars)
+        db.session.commit()
+
+
+def catalog(client):
+    return {item['id']: item for item in client.get('/api/reward-items').get_json()}
+
+
+def redeem(client, item_id):
+    response = client.post('/api/star-redemptions', json={'itemId': item_id})
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def redemption_ids(client, **params):
+    return [item['id'] for item in client.get('/api/star-redemptions', query_string=params).get_json()]
+
+
+def test_cancel_refunds_stars_once(app, client):
+    item = min(catalog(client).values(), key=lambda item: item['costStars'])
+    give_stars(app, item['costStars'] + 2)
+    assert redeem(client, item['id'])['remainingStars'] == 2
+    redemption_id = redemption_ids(client)[0]
+
+    response = client.post(f'/api/star-redemptions/{redemption_id}/cancel')
+    assert response.status_code == 200
+    assert response.get_json()['remainingStars'] == item['costStars'] + 2
+    assert response.get_json()['starsReturned'] == item['costStars']
+
+    # 重复取消不会再次退星
+    assert client.post(f'/api/star-redemptions/{redemption_id}/cancel').status_code == 400
+    assert client.get('/api/stars').get_json() == {'stars': item['costStars'] + 2}
+    assert client.get('/api/star-redemptions').get_json()[0]['status'] == 'cancelled'
+
+
+def test_catalog_and_stats_count_completed_redemptions_only(app, client):
+    items = sorted(catalog(client).values(), key=lambda item: item['costStars'])
+    cheap, other = items[0], items[1]
+    give_stars(app, cheap['costStars'] * 3 + other['costStars'])
+    redeem(client, cheap['id'])
+    redeem(client, cheap['id'])
+    redeem(client, other['id'])
+    cancelled = redemption_ids(client)[0]
+    client.post(f'/api/star-redemptions/{cancelled}/cancel')
+
+    items = catalog(client)
+    assert items[cheap['id']]['redemptionCount'] == 2
+    assert items[other['id']]['redemptionCount'] == 0
+    assert all(item['redemptionCount'] == 0 for item_id, item in items.items() if item_id not in (cheap['id'], other['id']))
+
+    stats = client.get('/api/star-redemptions/stats').get_json()
+    assert stats['totalRedemptions'] == 2
+    assert stats['totalStarsSpent'] == cheap['costStars'] * 2
+    assert stats['currentStars'] == cheap['costStars'] + other['costStars']
+    assert stats['totalStarsEarned'] == stats['currentStars'] + stats['totalStarsSpent']
+
+
+def test_history_filters_by_status_and_local_dates(app, client, monkeypatch):
+    monkeypatch.setitem(app.config, 'UTC_OFFSET_MINUTES', 480)
+    item_id = next(iter(catalog(client)))
+    with app.app_context():
+        # 北京时间分别为 03-01 23:30、03-02 00:30、03-02 23:30、03-03 08:00
+        rows = [
+            StarRedemption(item_id=item_id, stars_spent=1, redeemed_at=datetime(2026, 3, 1, 15, 30), status='completed'),
+            StarRedemption(item_id=item_id, stars_spent=1, redeemed_at=datetime(2026, 3, 1, 16, 30), status='completed'),
+            StarRedemption(item_id=item_id, stars_spent=1, redeemed_at=datetime(2026, 3, 2, 15, 30), status='cancelled'),
+            StarRedemption(item_id=item_id, stars_spent=1, redeemed_at=datetime(2026, 3, 3, 0, 0), status='completed'),
+        ]
+        db.session.add_all(rows)
+        db.session.commit()
+        ids = [row.id for row in rows]
+
+    assert redemption_ids(client) == ids[::-1]
+    assert redemption_ids(client, status='cancelled') == [ids[2]]
+    assert redemption_ids(client, status='completed') == [ids[3], ids[1], ids[0]]
+    assert redemption_ids(client, **{'from': '2026-03-02', 'to': '2026-03-02'}) == [ids[2], ids[1]]
+    assert redemption_ids(client, status='completed', **{'from': '2026-03-02'}) == [ids[3], ids[1]]
+    assert redemption_ids(client, to='2026-03-01') == [ids[0]]
+
+    page = client.get('/api/star-redemptions', query_string={'status': 'completed', 'limit': 2}).get_json()
+    assert [item['id'] for item in page['items']] == [ids[3], ids[1]]
+    assert page['hasMore'] is True
+
+
+def test_history_rejects_invalid_filters(client):
+    assert client.get('/api/star-redemptions', query_string={'status': 'refunded'}).status_code == 400
+    assert client.get('/api/star-redemptions', query_string={'from': '03/02/2026'}).status_code == 400
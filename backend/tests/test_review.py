@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app import Word, db, next_review
+
+
+def fresh_state():
+    return SimpleNamespace(review_reps=0, review_interval=0, review_ease=2.5, next_review_at=None)
+
+
+def test_sm2_intervals_grow_and_reset_on_failure():
+    # 以很久以前为复习时间，避免“还没到期”的分支
+    reviewed_at = datetime(2020, 1, 1)
+    state = fresh_state()
+    intervals = []
+    for quality in (4, 4, 4, 5):
+        state = SimpleNamespace(**next_review(state, quality, reviewed_at))
+        intervals.append(state.review_interval)
+    assert intervals[:2] == [1, 6]
+    assert intervals[2] == round(6 * 2.5)
+    assert intervals[3] > intervals[2]
+
+    failed = next_review(state, 1, reviewed_at)
+    assert (failed['review_reps'], failed['review_interval']) == (0, 1)
+    assert failed['review_ease'] < state.review_ease
+    assert failed['next_review_at'] == reviewed_at + timedelta(days=1)
+
+
+def test_ease_never_drops_below_minimum():
+    state = fresh_state()
+    for _ in range(20):
+        state = SimpleNamespace(**next_review(state, 0, datetime(2020, 1, 1)))
+    assert state.review_ease == 1.3
+
+
+def make_due(app, word_id):
+    with app.app_context():
+        db.session.get(Word, word_id).next_review_at = datetime.utcnow() - timedelta(days=1)
+        db.session.commit()
+
+
+def test_learned_word_enters_due_queue_and_review_reschedules(app, client):
+    client.post('/api/learn/1')
+    # 刚学会的字明天才复习
+    assert client.get('/api/review/due').get_json()['items'] == []
+
+    make_due(app, 1)
+    due = client.get('/api/review/due').get_json()['items']
+    assert [w['id'] for w in due] == [1]
+
+    result = client.post('/api/review/1', json={'quality': 4}).get_json()
+    assert result['reviewInterval'] == 6
+    assert result['stars'] == 2
+    assert client.get('/api/review/due').get_json()['items'] == []
+
+
+def test_failed_review_comes_back_tomorrow_without_star(app, client):
+    client.post('/api/learn/1')
+    make_due(app, 1)
+    result = client.post('/api/review/1', json={'quality': 1}).get_json()
+    assert (result['reviewInterval'], result['stars']) == (1, 1)
+
+
+def test_unlearned_word_cannot_be_reviewed(client):
+    for quality in (1, 4):
+        response = client.post('/api/review/1', json={'quality': quality})
+        assert response.status_code == 409
+        assert response.get_json()['code'] == 'not_learned'
+    assert client.get('/api/review/due').get_json()['items'] == []
+    assert client.get('/api/stars').get_json() == {'stars': 0}
+
+
+def test_invalid_quality_is_rejected(client):
+    client.post('/api/learn/1')
+    for quality in (True, 6, '4', None):
+        assert client.post('/api/review/1', json={'quality': quality}).status_code == 400
@@ -0,0 +1,10 @@
+def test_suggest_matches_pinyin_prefix_without_tones(client):
+    client.post('/api/words', json={'word': '闪', 'pinyin': 'shǎn'})
+    words = client.get('/api/words/suggest', query_string={'prefix': 'Shan'}).get_json()
+    assert '闪' in [w['word'] for w in words]
+
+
+def test_title_filter_ignores_case_like_mysql(client):
+    client.post('/api/books', json={'title': 'Harry Potter'})
+    books = client.get('/api/books', query_string={'q': 'harry'}).get_json()
+    assert [b['title'] for b in books] == ['Harry Potter']
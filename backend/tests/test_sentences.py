@@ -0,0 +1,31 @@
+def add_learned_word(client, word, pinyin):
+    word_id = client.post('/api/words', json={'word': word, 'pinyin': pinyin}).get_json()['id']
+    assert client.post(f'/api/learn/{word_id}').status_code == 200
+
+
+def available_sentences(client, **params):
+    return [item['sentence'] for item in client.get('/api/sentences/available', query_string=params).get_json()['items']]
+
+
+def test_available_sentences_count_polyphones_once(client):
+    assert client.post('/api/sentences', json={'sentence': '音乐会'}).status_code == 201
+    add_learned_word(client, '音', 'yīn')
+    # 同一个字的两个读音都学过，覆盖字数仍只算一次
+    add_learned_word(client, '乐', 'lè')
+    add_learned_word(client, '乐', 'yuè')
+
+    assert '音乐会' not in available_sentences(client)
+    assert '音乐会' in available_sentences(client, maxMissing=1)
+
+
+def test_available_sentences_order_by_missing_then_length(client):
+    # 长句先添加，id 顺序与期望的长度顺序相反
+    sentences = ('森林音乐会', '音乐会', '音乐')
+    for sentence in sentences:
+        assert client.post('/api/sentences', json={'sentence': sentence}).status_code == 201
+    for word, pinyin in (('森', 'sēn'), ('林', 'lín'), ('音', 'yīn'), ('乐', 'yuè')):
+        add_learned_word(client, word, pinyin)
+
+    ordered = [s for s in available_sentences(client, maxMissing=1) if s in sentences]
+    # “音乐”不缺字；另两句都只缺“会”，短句在前
+    assert ordered == ['音乐', '音乐会', '森林音乐会']
@@ -0,0 +1,53 @@
+import threading
+
+from app import STAR_RECORD_ID, StarRecord, adjust_stars, db, seed_default_data
+
+
+def star_rows(app):
+    with app.app_context():
+        return [(row.id, row.stars) for row in StarRecord.query.order_by(StarRecord.id)]
+
+
+def test_first_write_creates_the_single_balance_row(app, client):
+    with app.app_context():
+        StarRecord.query.delete()
+        db.session.commit()
+    assert client.get('/api/stars').get_json() == {'stars': 0}
+
+    client.post('/api/learn/1')
+    assert star_rows(app) == [(STAR_RECORD_ID, 1)]
+
+
+def test_concurrent_first_writes_share_one_row(app):
+    with app.app_context():
+        StarRecord.query.delete()
+        db.session.commit()
+
+    def earn():
+        with app.app_context():
+            adjust_stars(1)
+            db.session.commit()
+
+    threads = [threading.Thread(target=earn) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert star_rows(app) == [(STAR_RECORD_ID, 8)]
+
+
+def test_redeem_without_enough_stars_keeps_balance(app, client):
+    item = client.get('/api/reward-items').get_json()[0]
+    response = client.post('/api/star-redemptions', json={'itemId': item['id']})
+    assert response.status_code == 400
+    assert response.get_json()['code'] == 'insufficient_stars'
+    assert client.get('/api/stars').get_json() == {'stars': 0}
+
+
+def test_seed_keeps_earliest_of_duplicate_rows(app):
+    with app.app_context():
+        StarRecord.query.delete()
+        db.session.add_all([StarRecord(id=3, stars=7), StarRecord(id=5, stars=2)])
+        db.session.commit()
+        seed_default_data()
+    assert star_rows(app) == [(STAR_RECORD_ID, 7)]
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import app as app_module
+from app import LearningRecord, db, get_week_dates, rebuild_learning_weeks
+
+# UTC 2025-12-28（周日）20:00，北京时间已是 2025-12-29（周一）04:00，属于 ISO 2026 年第 1 周
+BOUNDARY_UTC = datetime(2025, 12, 28, 20, 0)
+
+
+class FrozenDatetime(datetime):
+    @classmethod
+    def utcnow(cls):
+        return BOUNDARY_UTC
+
+
+def test_iso_week_dates_cross_the_calendar_year():
+    first_day, last_day = get_week_dates(2026, 1)
+    assert (first_day.date().isoformat(), last_day.date().isoformat()) == ('2025-12-29', '2026-01-04')
+
+
+def test_weekly_daily_and_dashboard_agree_on_local_week(app, client, monkeypatch):
+    monkeypatch.setitem(app.config, 'UTC_OFFSET_MINUTES', 480)
+    monkeypatch.setattr(app_module, 'datetime', FrozenDatetime)
+    assert client.post('/api/learn/1').status_code == 200
+
+    weekly = client.get('/api/weekly-stats', query_string={'detail': 0}).get_json()
+    assert (weekly[0]['year'], weekly[0]['week'], weekly[0]['startDate']) == (2026, 1, '2025-12-29')
+
+    current = client.get('/api/current-week').get_json()
+    assert (current['year'], current['week'], current['count']) == (2026, 1, 1)
+
+    dashboard = client.get('/api/dashboard').get_json()
+    assert dashboard['currentWeek'] == current
+
+    daily = client.get('/api/stars/daily-stats', query_string={'from': '2025-12-29', 'to': '2025-12-29'}).get_json()
+    assert daily[0]['characters'] == 1
+
+
+def test_rebuild_learning_weeks_fixes_old_utc_weeks(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'UTC_OFFSET_MINUTES', 480)
+    with app.app_context():
+        # 旧版本按 UTC 和日历年记录：2025 年第 52 周
+        record = LearningRecord(word_id=1)
+        record.learned_at, record.year, record.week = BOUNDARY_UTC, 2025, 52
+        db.session.add(record)
+        db.session.commit()
+
+        assert rebuild_learning_weeks() == 1
+        assert rebuild_learning_weeks() == 0
+        assert (record.year, record.week) == (2026, 1)
+
+
+def test_invalid_week_is_rejected(client):
+    assert client.get('/api/weekly-words/2025/60').status_code == 400
@@ -0,0 +1,78 @@
+from datetime import datetime
+
+from app import TaskCompletion, db
+
+
+def add_task(client, name, reward_stars=2):
+    response = client.post('/api/daily-tasks', json={'taskName': name, 'rewardStars': reward_stars})
+    assert response.status_code == 201
+    return response.get_json()['id']
+
+
+def add_completions(app, task_id, *moments):
+    with app.app_context():
+        db.session.add_all([TaskCompletion(task_id=task_id, completed_at=moment, stars_earned=2) for moment in moments])
+        db.session.commit()
+
+
+def board(client, **params):
+    return {task['id']: task for task in client.get('/api/daily-tasks', query_string=params).get_json()}
+
+
+def test_board_counts_completions_on_the_requested_local_day(app, client, monkeypatch):
+    monkeypatch.setitem(app.config, 'UTC_OFFSET_MINUTES', 480)
+    reading = add_task(client, '读书')
+    sweeping = add_task(client, '扫地')
+    idle = add_task(client, '浇花')
+    # 北京时间 2026-03-02 当天：UTC 03-01 16:00 起至 03-02 16:00 前
+    add_completions(
+        app, reading,
+        datetime(2026, 3, 1, 15, 59),  # 北京时间 03-01 23:59
+        datetime(2026, 3, 1, 16, 0),
+        datetime(2026, 3, 2, 8, 30),
+    )
+    add_completions(app, sweeping, datetime(2026, 3, 2, 16, 0))  # 北京时间 03-03 00:00
+
+    tasks = board(client, date='2026-03-02')
+    assert (tasks[reading]['dayCompletions'], tasks[reading]['completedOnDay']) == (2, True)
+    assert tasks[reading]['completionsCount'] == 3
+    assert tasks[reading]['lastCompletedAt'] == '2026-03-02T08:30:00'
+    assert (tasks[sweeping]['dayCompletions'], tasks[sweeping]['completedOnDay']) == (0, False)
+    assert tasks[sweeping]['completionsCount'] == 1
+    assert tasks[idle]['completionsCount'] == 0
+    assert tasks[idle]['lastCompletedAt'] is None
+    assert tasks[idle]['completedOnDay'] is False
+
+    tasks = board(client, date='2026-03-03')
+    assert tasks[reading]['dayCompletions'] == 0
+    assert tasks[sweeping]['dayCompletions'] == 1
+
+
+def test_board_is_one_query(client, count_queries):
+    for name in ('读书', '扫地', '浇花'):
+        task_id = add_task(client, name)
+        client.post(f'/api/daily-tasks/{task_id}/complete', json={})
+
+    with count_queries() as statements:
+        response = client.get('/api/daily-tasks')
+    assert response.status_code == 200
+    assert len(statements) == 1
+
+
+def test_completing_today_shows_on_the_default_board(client):
+    task_id = add_task(client, '读书', reward_stars=3)
+    before = client.get('/api/stars').get_json()['stars']
+
+    response = client.post(f'/api/daily-tasks/{task_id}/complete', json={'notes': '三十分钟'})
+    assert response.status_code == 200
+    assert response.get_json()['stars'] == before + 3
+
+    task = board(client)[task_id]
+    assert (task['completionsCount'], task['dayCompletions'], task['completedOnDay']) == (1, 1, True)
+
+    completions = client.get(f'/api/daily-tasks/{task_id}/completions').get_json()
+    assert [(item['notes'], item['starsEarned']) for item in completions] == [('三十分钟', 3)]
+
+
+def test_board_rejects_invalid_date(client):
+    assert client.get('/api/daily-tasks', query_string={'date': '2026/03/02'}).status_code == 400
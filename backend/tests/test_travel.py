@@ -0,0 +1,96 @@
+from sqlalchemy import func
+
+from app import TravelFootprint, TravelPlan, db
+
+
+def add_plan(client, destination, budget):
+    response = client.post('/api/travel-plans', json={'destination': destination, 'budget': budget})
+    assert response.status_code == 201
+    return response.get_json()['id']
+
+
+def add_footprint(client, plan_id, expense):
+    response = client.post(f'/api/travel-plans/{plan_id}/footprints', json={'expense': expense})
+    assert response.status_code == 201
+    return response.get_json()['id']
+
+
+def plan_by_id(client, plan_id):
+    return next(plan for plan in client.get('/api/travel-plans').get_json() if plan['id'] == plan_id)
+
+
+def test_footprints_keep_plan_totals(app, client):
+    plan_id = add_plan(client, '杭州', 1000)
+    first = add_footprint(client, plan_id, 120.5)
+    add_footprint(client, plan_id, 300)
+    add_footprint(client, plan_id, 79.5)
+
+    plan = plan_by_id(client, plan_id)
+    assert plan['totalExpense'] == 500
+    assert plan['footprintCount'] == 3
+
+    assert client.delete(f'/api/travel-footprints/{first}').status_code == 200
+    plan = plan_by_id(client, plan_id)
+    assert plan['totalExpense'] == 379.5
+    assert plan['footprintCount'] == 2
+
+    # 存储的汇总与足迹表一致
+    with app.app_context():
+        expense, count = db.session.query(
+            func.coalesce(func.sum(TravelFootprint.expense), 0), func.count(TravelFootprint.id)
+        ).filter_by(plan_id=plan_id).one()
+        stored = db.session.get(TravelPlan, plan_id)
+        assert (float(stored.total_expense), stored.footprint_count) == (float(expense), count)
+
+
+def test_plan_update_keeps_totals(client):
+    plan_id = add_plan(client, '成都', 800)
+    add_footprint(client, plan_id, 200)
+
+    response = client.put(f'/api/travel-plans/{plan_id}', json={'budget': 900, 'isCompleted': True})
+    assert response.status_code == 200
+    plan = response.get_json()
+    assert plan['totalExpense'] == 200
+    assert plan['footprintCount'] == 1
+    assert plan['isCompleted'] is True
+
+
+def test_summary_reports_remaining_and_over_budget(client):
+    under = add_plan(client, '苏州', 500)
+    over = add_plan(client, '西安', 300)
+    add_footprint(client, under, 100)
+    add_footprint(client, over, 250)
+    add_footprint(client, over, 150)
+
+    summary = client.get('/api/travel-plans/summary').get_json()
+    assert summary['planCount'] == 2
+    assert summary['totalBudget'] == 800
+    assert summary['totalExpense'] == 500
+    assert summary['remaining'] == 300
+    assert summary['footprintCount'] == 3
+    assert summary['overBudgetCount'] == 1
+
+    plans = {plan['id']: plan for plan in summary['plans']}
+    assert plans[under]['remaining'] == 400
+    assert plans[under]['overBudget'] is False
+    assert plans[over]['remaining'] == -100
+    assert plans[over]['overBudget'] is True
+
+
+def test_summary_follows_footprint_writes(client):
+    plan_id = add_plan(client, '厦门', 600)
+    response = client.get('/api/travel-plans/summary')
+    etag = response.headers['ETag']
+    assert response.get_json()['totalExpense'] == 0
+
+    add_footprint(client, plan_id, 60)
+    response = client.get('/api/travel-plans/summary', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['totalExpense'] == 60
+
+
+def test_footprint_requires_expense(client):
+    plan_id = add_plan(client, '大理', 100)
+    assert client.post(f'/api/travel-plans/{plan_id}/footprints', json={}).status_code == 400
+    assert client.post('/api/travel-plans/9999/footprints', json={'expense': 1}).status_code == 404
+    assert plan_by_id(client, plan_id)['footprintCount'] == 0
@@ -0,0 +1,91 @@
+import json
+
+from app import IMPORT_BATCH_SIZE, ActivityEvent
+
+
+def add_word(client, word, pinyin=''):
+    response = client.post('/api/words', json={'word': word, 'pinyin': pinyin})
+    assert response.status_code == 201
+    return response.get_json()
+
+
+def import_csv(client, text):
+    response = client.post('/api/words/import?format=csv', data=text.encode('utf-8'), content_type='text/csv')
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_import_keeps_polyphone_readings(client):
+    result = import_csv(client, 'word,pinyin,meaning\n行,xíng,走路\n行,háng,银行\n行,xing,重复\n行,,没填拼音\n')
+    assert result['inserted'] == 2
+    assert result['skipped'] == 2
+
+    words = client.get('/api/words', query_string={'q': '行'}).get_json()
+    assert sorted(w['pinyin'] for w in words) == ['háng', 'xíng']
+
+
+def test_import_skips_same_reading_already_in_library(client):
+    assert client.post('/api/words', json={'word': '长', 'pinyin': 'cháng'}).status_code == 201
+
+    result = import_csv(client, 'word,pinyin\n长,chang\n长,zhǎng\n')
+    assert result['inserted'] == 1
+    assert result['skipped'] == 1
+
+
+def test_learn_batch_rejects_booleans(client):
+    response = client.post('/api/learn/batch', json={'wordIds': [1, True]})
+    assert response.status_code == 400
+
+
+def test_learn_batch_reports_duplicates(client):
+    word_id = add_word(client, '森', 'sēn')['id']
+    result = client.post('/api/learn/batch', json={'wordIds': [word_id, word_id, 999999]}).get_json()
+    assert result['learnedCount'] == 1
+    assert [r['status'] for r in result['results']] == ['learned', 'duplicate', 'not_found']
+
+
+def test_large_import_passes_query_guard(app, client):
+    # 批数超过 QUERY_GUARD_REPEAT_LIMIT，每批重复同一组语句，不应被判为 N+1
+    rows = IMPORT_BATCH_SIZE * (app.config['QUERY_GUARD_REPEAT_LIMIT'] + 1)
+    text = 'word,pinyin\n' + ''.join(f'字{i},zi{i}\n' for i in range(rows))
+    result = import_csv(client, text)
+    assert result['inserted'] == rows
+
+
+def test_word_list_carries_learning_summary(client):
+    word = add_word(client, '森', 'sēn')
+    client.post(f'/api/learn/{word["id"]}')
+    client.post(f'/api/learn/{word["id"]}')
+
+    listed = {w['id']: w for w in client.get('/api/words').get_json()}[word['id']]
+    assert listed['learned'] is True
+    assert listed['learnCount'] == 2
+    assert listed['firstLearnedAt'] and listed['lastReviewed']
+
+    client.post('/api/stars/reset')
+    listed = {w['id']: w for w in client.get('/api/words').get_json()}[word['id']]
+    assert (listed['learned'], listed['learnCount'], listed['firstLearnedAt']) == (False, 0, None)
+
+
+def test_word_list_query_count_does_not_grow_with_words(client, count_queries):
+    with count_queries() as few:
+        client.get('/api/words')
+    import_csv(client, ''.join(f'字{i},zi{i}\n' for i in range(50)))
+    for word in client.get('/api/words').get_json()[:10]:
+        client.post(f'/api/learn/{word["id"]}')
+    with count_queries() as many:
+        client.get('/api/words')
+    assert len(many) == len(few)
+
+
+def test_batch_and_single_learn_publish_same_event_shape(app, client):
+    first = add_word(client, '森', 'sēn')
+    second = add_word(client, '林', 'lín')
+    client.post(f'/api/learn/{first["id"]}')
+    client.post('/api/learn/batch', json={'wordIds': [second['id'], first['id']]})
+
+    with app.app_context():
+        single, batch = [json.loads(e.payload) for e in ActivityEvent.query.filter_by(event_type='learn').order_by(ActivityEvent.id)]
+    assert set(single) == set(batch)
+    assert batch['wordIds'] == sorted([first['id'], second['id']])
+    assert batch['words'] == ['森', '林']
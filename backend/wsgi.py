@@ -0,0 +1,5 @@
+"""WSGI入口（生产环境由 gunicorn 加载：gunicorn -c gunicorn.conf.py wsgi:app）"""
+from app import app
+
+if __name__ == '__main__':
+    app.run()
@@ -14,11 +14,10 @@ import DailyTasks from './components/DailyTasks'
 import MyRewards from './components/MyRewards'
 import StarExchange from './components/StarExchange'
 import StarsChart from './components/StarsChart'
-import { wordAPI, learningAPI, starAPI } from './services/api'
+import { wordAPI, learningAPI, starAPI, eventsAPI } from './services/api'
 
 function App() {
   const [currentView, setCurrentView] = useState('dashboard')
-  const [words, setWords] = useState([])
   const [stars, setStars] = useState(0)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState(null)
@@ -28,18 +27,22 @@ function App() {
     loadData()
   }, [])
 
+  // 订阅实时事件，星星余额随任意写操作（包括其他设备）更新
+  useEffect(() => {
+    return eventsAPI.subscribe((event) => {
+      if (typeof event.stars === 'number') {
+        setStars(event.stars)
+      }
+    })
+  }, [])
+
   const loadData = async () => {
     try {
       setLoading(true)
       setError(null)
       
-      // 并行加载汉字和星星数据
-      const [wordsData, starsData] = await Promise.all([
-        wordAPI.getAll(),
-        starAPI.get()
-      ])
-      
-      setWords(wordsData)
+      // 汉字由各页面按需分页加载，这里只取星星余额
+      const starsData = await starAPI.get()
       setStars(starsData.stars)
     } catch (err) {
       console.error('加载数据失败:', err)
@@ -52,9 +55,7 @@ function App() {
   // 添加新汉字
   const addWord = async (word) => {
     try {
-      const newWord = await wordAPI.add(word)
-      setWords([...words, newWord])
-      return newWord
+      return await wordAPI.add(word)
     } catch (err) {
       console.error('添加汉字失败:', err)
       alert('添加汉字失败，请重试')
@@ -66,7 +67,6 @@ function App() {
   const deleteWord = async (id) => {
     try {
       await wordAPI.delete(id)
-      setWords(words.filter(w => w.id !== id))
     } catch (err) {
       console.error('删除汉字失败:', err)
       alert('删除汉字失败，请重试')
@@ -77,9 +77,7 @@ function App() {
   // 编辑汉字
   const editWord = async (id, updatedWord) => {
     try {
-      const updated = await wordAPI.update(id, updatedWord)
-      setWords(words.map(w => w.id === id ? updated : w))
-      return updated
+      return await wordAPI.update(id, updatedWord)
     } catch (err) {
       console.error('编辑汉字失败:', err)
       alert('编辑汉字失败，请重试')
@@ -91,13 +89,6 @@ function App() {
   const markAsLearned = async (id) => {
     try {
       const result = await learningAPI.markAsLearned(id)
-      
-      // 更新本地状态
-      setWords(words.map(w => 
-        w.id === id 
-          ? { ...w, learned: true, lastReviewed: new Date().toISOString() }
-          : w
-      ))
       setStars(result.stars)
       
       return result
@@ -160,7 +151,6 @@ function App() {
         <div className="p-6">
           {currentView === 'dashboard' && (
             <Dashboard 
-              words={words} 
               stars={stars}
               resetProgress={resetProgress}
             />
@@ -168,7 +158,6 @@ function App() {
           
           {currentView === 'library' && (
             <WordLibrary 
-              words={words}
               addWord={addWord}
               deleteWord={deleteWord}
               editWord={editWord}
@@ -177,13 +166,12 @@ function App() {
           
           {currentView === 'learning' && (
             <LearningMode 
-              words={words}
               markAsLearned={markAsLearned}
             />
           )}
 
           {currentView === 'practice' && (
-            <SentencePractice words={words} />
+            <SentencePractice />
           )}
           
           {currentView === 'rewards' && (
@@ -207,7 +195,7 @@ function App() {
           )}
 
           {currentView === 'travel-map' && (
-            <TravelFootprintMap />
+            <TravelFootprintMap stars={stars} />
           )}
 
           {currentView === 'tasks' && (
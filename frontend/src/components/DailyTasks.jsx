@@ -251,6 +251,11 @@ const DailyTasks = () => {
               <div className="flex items-center gap-2 mb-4">
                 <CheckSquare size={24} className="text-green-600" />
                 <h3 className="text-2xl font-bold text-gray-800 flex-1">{task.taskName}</h3>
+                {task.completedOnDay && (
+                  <span className="text-xs font-bold text-green-700 bg-green-100 px-2 py-1 rounded-full">
+                    今天已完成{task.dayCompletions > 1 ? ` ${task.dayCompletions} 次` : ''}
+                  </span>
+                )}
               </div>
 
               {task.description && (
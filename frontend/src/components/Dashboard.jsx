@@ -1,9 +1,20 @@
-import React from 'react'
+import React, { useState, useEffect } from 'react'
 import { TrendingUp, Award, Target, RotateCcw } from 'lucide-react'
+import { dashboardAPI } from '../services/api'
 
-const Dashboard = ({ words, stars, resetProgress }) => {
-  const totalWords = words.length
-  const learnedWords = words.filter(w => w.learned).length
+const Dashboard = ({ stars, resetProgress }) => {
+  const [summary, setSummary] = useState(null)
+
+  // 一次请求取回看板所需的全部统计；星星变化（学习、重置）后重新加载
+  useEffect(() => {
+    dashboardAPI.get()
+      .then(setSummary)
+      .catch(err => console.error('加载看板失败:', err))
+  }, [stars])
+
+  const totalWords = summary ? summary.words.total : 0
+  const learnedWords = summary ? summary.words.learned : 0
+  const recentWords = summary ? summary.recentWords : []
   const progress = totalWords > 0 ? Math.round((learnedWords / totalWords) * 100) : 0
 
   const stats = [
@@ -30,6 +41,13 @@ const Dashboard = ({ words, stars, resetProgress }) => {
     },
   ]
 
+  const details = summary ? [
+    { label: '本周学习', value: `${summary.currentWeek.count} 个字` },
+    { label: '读完的书', value: `${summary.reading.completedBooks}/${summary.reading.totalBooks}` },
+    { label: '背会的古诗', value: `${summary.poems.completed}/${summary.poems.total}` },
+    { label: '兑换奖励', value: `${summary.redemptions.totalRedemptions} 次` },
+  ] : []
+
   return (
     <div className="space-y-6">
       {/* 统计卡片 */}
@@ -54,6 +72,18 @@ const Dashboard = ({ words, stars, resetProgress }) => {
         })}
       </div>
 
+      {/* 其他统计 */}
+      {details.length > 0 && (
+        <div className="grid grid-cols-2 md:grid-cols-4 gap-4">
+          {details.map((detail) => (
+            <div key={detail.label} className="bg-white rounded-2xl p-4 shadow-md text-center">
+              <p className="text-gray-500">{detail.label}</p>
+              <p className="text-2xl font-bold text-purple-600 mt-1">{detail.value}</p>
+            </div>
+          ))}
+        </div>
+      )}
+
       {/* 进度条 */}
       <div className="bg-white rounded-3xl p-8 shadow-lg">
         <div className="flex items-center justify-between mb-4">
@@ -80,21 +110,16 @@ const Dashboard = ({ words, stars, resetProgress }) => {
           </div>
         ) : (
           <div className="grid grid-cols-2 md:grid-cols-4 lg:grid-cols-6 gap-4">
-            {words
-              .filter(w => w.learned)
-              .sort((a, b) => new Date(b.lastReviewed) - new Date(a.lastReviewed))
-              .slice(0, 12)
-              .map((word, index) => (
-                <div 
-                  key={word.id}
-                  className="bg-gradient-to-br from-purple-100 to-pink-100 rounded-2xl p-6 text-center shadow-md hover:shadow-xl transition-all hover:scale-105 bounce-in"
-                  style={{ animationDelay: `${index * 0.05}s` }}
-                >
-                  <div className="text-5xl font-bold text-purple-700 mb-2">{word.word}</div>
-                  <div className="text-lg text-gray-600">{word.pinyin}</div>
-                </div>
-              ))
-            }
+            {recentWords.map((word, index) => (
+              <div 
+                key={word.id}
+                className="bg-gradient-to-br from-purple-100 to-pink-100 rounded-2xl p-6 text-center shadow-md hover:shadow-xl transition-all hover:scale-105 bounce-in"
+                style={{ animationDelay: `${index * 0.05}s` }}
+              >
+                <div className="text-5xl font-bold text-purple-700 mb-2">{word.word}</div>
+                <div className="text-lg text-gray-600">{word.pinyin}</div>
+              </div>
+            ))}
           </div>
         )}
       </div>
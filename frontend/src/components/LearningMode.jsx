@@ -1,14 +1,119 @@
 import React, { useState, useEffect } from 'react'
-import { ChevronLeft, ChevronRight, CheckCircle, Sparkles } from 'lucide-react'
+import { ChevronLeft, ChevronRight, CheckCircle, Sparkles, RotateCcw } from 'lucide-react'
+import { wordAPI, learningAPI } from '../services/api'
 
-const LearningMode = ({ words, markAsLearned }) => {
+const REVIEW_BATCH = 20
+const LEARN_BATCH = 20
+
+// 今日复习：按到期先后逐个复习，记住了 / 没记住 决定下次复习的间隔
+const ReviewQueue = () => {
+  const [queue, setQueue] = useState([])
+  const [submitting, setSubmitting] = useState(false)
+
+  useEffect(() => {
+    loadDue()
+  }, [])
+
+  const loadDue = async () => {
+    try {
+      const data = await learningAPI.getDueReviews(REVIEW_BATCH)
+      setQueue(data.items)
+    } catch (err) {
+      console.error('加载复习列表失败:', err)
+    }
+  }
+
+  const handleReview = async (quality) => {
+    setSubmitting(true)
+    try {
+      await learningAPI.review(queue[0].id, quality)
+      const rest = queue.slice(1)
+      setQueue(rest)
+      if (rest.length === 0) {
+        await loadDue()
+      }
+    } catch (err) {
+      alert('提交复习结果失败，请重试')
+    } finally {
+      setSubmitting(false)
+    }
+  }
+
+  if (queue.length === 0) {
+    return null
+  }
+
+  const current = queue[0]
+  return (
+    <div className="bg-white rounded-3xl p-6 shadow-lg">
+      <div className="flex items-center justify-between mb-4">
+        <span className="text-xl font-bold text-gray-700 flex items-center gap-2">
+          <RotateCcw size={24} className="text-blue-500" />
+          今日复习
+        </span>
+        <span className="text-lg font-bold text-blue-600">还有 {queue.length} 个</span>
+      </div>
+      <div className="flex items-center gap-6">
+        <div className="text-7xl font-bold text-gray-800 w-28 text-center">{current.word}</div>
+        <div className="flex-1 flex gap-3">
+          <button
+            onClick={() => handleReview(1)}
+            disabled={submitting}
+            className="flex-1 bg-gradient-to-r from-orange-400 to-red-500 text-white px-4 py-4 rounded-2xl font-bold text-lg shadow-lg transition-all hover:scale-105 active:scale-95 disabled:opacity-50"
+          >
+            没记住
+          </button>
+          <button
+            onClick={() => handleReview(4)}
+            disabled={submitting}
+            className="flex-1 bg-gradient-to-r from-green-400 to-green-600 text-white px-4 py-4 rounded-2xl font-bold text-lg shadow-lg transition-all hover:scale-105 active:scale-95 disabled:opacity-50"
+          >
+            记住了 +1⭐
+          </button>
+        </div>
+      </div>
+    </div>
+  )
+}
+
+const LearningMode = ({ markAsLearned }) => {
   const [currentIndex, setCurrentIndex] = useState(0)
   const [celebrationMode, setCelebrationMode] = useState(false)
   const [stars, setStars] = useState([])
   const [loading, setLoading] = useState(false)
+  // 未学习的汉字按页加载，不再一次性拉取整个字库
+  const [unlearnedWords, setUnlearnedWords] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
+  const [total, setTotal] = useState(0)
+  const [listLoading, setListLoading] = useState(true)
 
-  // 只显示未学习的汉字
-  const unlearnedWords = words.filter(w => !w.learned)
+  useEffect(() => {
+    loadWords(true)
+  }, [])
+
+  const loadWords = async (reset = false) => {
+    setListLoading(true)
+    try {
+      const data = await wordAPI.getPage({
+        limit: LEARN_BATCH,
+        cursor: reset ? null : nextCursor,
+        learned: 0
+      })
+      setUnlearnedWords(prev => reset ? data.items : [...prev, ...data.items])
+      setNextCursor(data.nextCursor)
+      if (reset) {
+        // total 是整个字库的数量，减去已学会的即为待学习数
+        setTotal(data.total - data.learnedTotal)
+        setCurrentIndex(0)
+      }
+      return data.items.length
+    } catch (err) {
+      console.error('加载汉字失败:', err)
+      return 0
+    } finally {
+      setListLoading(false)
+    }
+  }
 
   // 当unlearnedWords变化时（比如某个字被标记为已学习），自动调整索引
   useEffect(() => {
@@ -23,9 +128,13 @@ const LearningMode = ({ words, markAsLearned }) => {
     })
   }, [unlearnedWords.length]) // 只依赖数组长度，避免循环
 
-  const handleNext = () => {
+  const handleNext = async () => {
     if (currentIndex < unlearnedWords.length - 1) {
       setCurrentIndex(currentIndex + 1)
+    } else if (nextCursor) {
+      // 已到本页末尾，继续加载下一页
+      const loaded = await loadWords()
+      setCurrentIndex(loaded > 0 ? currentIndex + 1 : 0)
     } else {
       setCurrentIndex(0)
     }
@@ -45,6 +154,13 @@ const LearningMode = ({ words, markAsLearned }) => {
     
     try {
       await markAsLearned(word.id)
+      const rest = unlearnedWords.filter(w => w.id !== word.id)
+      setUnlearnedWords(rest)
+      setTotal(prev => Math.max(0, prev - 1))
+      if (rest.length === 0) {
+        // 本页学完了，重新拉取剩余未学习的汉字
+        await loadWords(true)
+      }
       
       // 触发庆祝动画
       setCelebrationMode(true)
@@ -53,7 +169,7 @@ const LearningMode = ({ words, markAsLearned }) => {
       setTimeout(() => {
         setCelebrationMode(false)
         setStars([])
-        // 标记为已学习后，当前字会被从unlearnedWords中移除
+        // 标记为已学习后，当前字已从unlearnedWords中移除
         // useEffect会自动调整currentIndex，所以这里不需要手动调用handleNext()
       }, 2000)
     } catch (err) {
@@ -77,12 +193,25 @@ const LearningMode = ({ words, markAsLearned }) => {
   }
 
   if (unlearnedWords.length === 0) {
+    if (listLoading) {
+      return (
+        <div className="space-y-6">
+          <ReviewQueue />
+          <div className="bg-white rounded-3xl p-12 shadow-lg text-center text-2xl text-gray-500">
+            加载中...
+          </div>
+        </div>
+      )
+    }
     return (
-      <div className="bg-white rounded-3xl p-12 shadow-lg text-center">
-        <div className="text-8xl mb-6">🎉</div>
-        <h2 className="text-4xl font-bold text-gray-800 mb-4">太棒了！</h2>
-        <p className="text-2xl text-gray-600 mb-6">你已经学完所有汉字啦！</p>
-        <p className="text-xl text-gray-500">可以去汉字库添加更多汉字继续学习哦！</p>
+      <div className="space-y-6">
+        <ReviewQueue />
+        <div className="bg-white rounded-3xl p-12 shadow-lg text-center">
+          <div className="text-8xl mb-6">🎉</div>
+          <h2 className="text-4xl font-bold text-gray-800 mb-4">太棒了！</h2>
+          <p className="text-2xl text-gray-600 mb-6">你已经学完所有汉字啦！</p>
+          <p className="text-xl text-gray-500">可以去汉字库添加更多汉字继续学习哦！</p>
+        </div>
       </div>
     )
   }
@@ -91,18 +220,20 @@ const LearningMode = ({ words, markAsLearned }) => {
 
   return (
     <div className="space-y-6">
+      <ReviewQueue />
+
       {/* 进度指示器 */}
       <div className="bg-white rounded-3xl p-6 shadow-lg">
         <div className="flex items-center justify-between mb-3">
           <span className="text-xl font-bold text-gray-700">学习进度</span>
           <span className="text-2xl font-bold text-purple-600">
-            {currentIndex + 1} / {unlearnedWords.length}
+            {currentIndex + 1} / {total}
           </span>
         </div>
         <div className="h-4 bg-gray-200 rounded-full overflow-hidden">
           <div 
             className="h-full bg-gradient-to-r from-purple-500 to-pink-500 transition-all duration-500"
-            style={{ width: `${((currentIndex + 1) / unlearnedWords.length) * 100}%` }}
+            style={{ width: `${Math.min(100, ((currentIndex + 1) / Math.max(total, 1)) * 100)}%` }}
           ></div>
         </div>
       </div>
@@ -174,7 +305,7 @@ const LearningMode = ({ words, markAsLearned }) => {
         </button>
         
         <div className="text-white text-lg font-bold bg-white bg-opacity-20 px-6 py-4 rounded-2xl">
-          还有 {unlearnedWords.length} 个汉字待学习
+          还有 {total} 个汉字待学习
         </div>
 
         <button
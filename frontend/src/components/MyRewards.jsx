@@ -15,10 +15,10 @@ const MyRewards = ({ stars, onRefresh }) => {
       setLoading(true)
       const [statsData, redemptionsData] = await Promise.all([
         fetch('/api/star-redemptions/stats').then(r => r.json()),
-        fetch('/api/star-redemptions').then(r => r.json())
+        fetch('/api/star-redemptions?status=completed').then(r => r.json())
       ])
       setStats(statsData)
-      setRedemptions(redemptionsData.filter(r => r.status === 'completed'))
+      setRedemptions(redemptionsData)
     } catch (err) {
       console.error('加载数据失败:', err)
     } finally {
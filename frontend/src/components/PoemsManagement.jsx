@@ -1,8 +1,28 @@
 import React, { useState, useEffect } from 'react'
-import { BookOpen, Plus, Trash2, Edit2, CheckCircle, Star, Award } from 'lucide-react'
+import { BookOpen, Plus, Trash2, Edit2, CheckCircle, Star, Award, Search } from 'lucide-react'
+import { withQuery } from '../services/api'
+
+const PAGE_SIZE = 20
+
+// 按 [起, 止) 区间高亮文本
+const Highlighted = ({ text, spans }) => {
+  const parts = []
+  let last = 0
+  spans.forEach(([start, end]) => {
+    if (start > last) parts.push(text.slice(last, start))
+    parts.push(<mark key={start} className="bg-yellow-200 rounded px-0.5">{text.slice(start, end)}</mark>)
+    last = end
+  })
+  parts.push(text.slice(last))
+  return <>{parts}</>
+}
 
 const PoemsManagement = () => {
   const [poems, setPoems] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
+  const [totalCount, setTotalCount] = useState(0)
+  const [completedCount, setCompletedCount] = useState(0)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [loading, setLoading] = useState(true)
   const [showAddForm, setShowAddForm] = useState(false)
   const [editingPoem, setEditingPoem] = useState(null)
@@ -11,17 +31,23 @@ const PoemsManagement = () => {
     author: '',
     content: ''
   })
+  const [searchQuery, setSearchQuery] = useState('')
+  const [searchResults, setSearchResults] = useState(null)
 
   useEffect(() => {
     loadPoems()
   }, [])
 
+  // 重新加载第一页（附带总数统计）
   const loadPoems = async () => {
     try {
       setLoading(true)
-      const response = await fetch('/api/poems')
+      const response = await fetch(withQuery('/api/poems', { limit: PAGE_SIZE }))
       const data = await response.json()
-      setPoems(data)
+      setPoems(data.items)
+      setNextCursor(data.nextCursor)
+      setTotalCount(data.total)
+      setCompletedCount(data.completedTotal)
     } catch (err) {
       console.error('加载古诗失败:', err)
     } finally {
@@ -29,6 +55,37 @@ const PoemsManagement = () => {
     }
   }
 
+  // 加载下一页
+  const loadMorePoems = async () => {
+    try {
+      setLoadingMore(true)
+      const response = await fetch(withQuery('/api/poems', { limit: PAGE_SIZE, cursor: nextCursor }))
+      const data = await response.json()
+      setPoems([...poems, ...data.items])
+      setNextCursor(data.nextCursor)
+    } catch (err) {
+      console.error('加载古诗失败:', err)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
+  // 全文检索（标题、作者、正文）
+  const handleSearch = async (e) => {
+    e.preventDefault()
+    if (!searchQuery.trim()) {
+      setSearchResults(null)
+      return
+    }
+    try {
+      const response = await fetch(withQuery('/api/poems/search', { q: searchQuery }))
+      const data = await response.json()
+      setSearchResults(data.items || [])
+    } catch (err) {
+      console.error('检索古诗失败:', err)
+    }
+  }
+
   const handleSubmit = async (e) => {
     e.preventDefault()
     try {
@@ -110,9 +167,6 @@ const PoemsManagement = () => {
     })
   }
 
-  const completedCount = poems.filter(p => p.isCompleted).length
-  const totalCount = poems.length
-
   if (loading) {
     return (
       <div className="bg-white rounded-3xl p-12 shadow-lg text-center">
@@ -212,6 +266,43 @@ const PoemsManagement = () => {
         </div>
       )}
 
+      {/* 检索 */}
+      <div className="bg-white rounded-3xl p-6 shadow-lg">
+        <form onSubmit={handleSearch} className="flex gap-3">
+          <input
+            type="text"
+            value={searchQuery}
+            onChange={(e) => setSearchQuery(e.target.value)}
+            placeholder="搜索诗名、作者或诗句"
+            className="flex-1 px-4 py-3 text-lg border-2 border-orange-200 rounded-2xl focus:border-orange-500 focus:outline-none"
+          />
+          <button
+            type="submit"
+            className="bg-gradient-to-r from-orange-500 to-red-500 text-white px-6 py-3 rounded-2xl font-bold flex items-center gap-2"
+          >
+            <Search size={20} />
+            搜索
+          </button>
+        </form>
+        {searchResults && (
+          <div className="mt-4 space-y-3">
+            {searchResults.length === 0 ? (
+              <p className="text-gray-400 text-center">没有找到相关的古诗</p>
+            ) : searchResults.map((result) => (
+              <div key={result.id} className="bg-orange-50 rounded-2xl p-4">
+                <div className="text-xl font-bold text-gray-800">
+                  <Highlighted text={result.title} spans={result.titleHighlights} />
+                  {result.author && <span className="text-base text-gray-500 ml-3">{result.author}</span>}
+                </div>
+                <p className="text-gray-700 font-serif mt-1 whitespace-pre-wrap">
+                  <Highlighted text={result.snippet} spans={result.highlights} />
+                </p>
+              </div>
+            ))}
+          </div>
+        )}
+      </div>
+
       {/* 古诗列表 */}
       <div className="bg-white rounded-3xl p-8 shadow-lg">
         <h3 className="text-2xl font-bold text-gray-800 mb-6 flex items-center gap-3">
@@ -296,6 +387,17 @@ const PoemsManagement = () => {
             ))}
           </div>
         )}
+        {nextCursor && (
+          <div className="flex justify-center mt-6">
+            <button
+              onClick={loadMorePoems}
+              disabled={loadingMore}
+              className="bg-gradient-to-r from-orange-500 to-red-500 text-white px-8 py-3 rounded-2xl font-bold text-lg shadow-lg hover:shadow-xl transition-all hover:scale-105 active:scale-95 disabled:opacity-50"
+            >
+              {loadingMore ? '加载中...' : '加载更多'}
+            </button>
+          </div>
+        )}
       </div>
 
       {/* 成就卡片 */}
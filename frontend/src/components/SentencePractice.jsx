@@ -1,59 +1,53 @@
-import React, { useState, useEffect } from 'react'
+import React, { useState, useEffect, useMemo } from 'react'
 import { BookOpen, Check, X, Lightbulb, RefreshCw, Award } from 'lucide-react'
+import { sentenceAPI } from '../services/api'
 
-const SentencePractice = ({ words }) => {
+// 除本题的字外，最多再混入几个干扰字
+const DISTRACTOR_COUNT = 8
+
+const SentencePractice = () => {
   const [currentSentenceIndex, setCurrentSentenceIndex] = useState(0)
   const [userInput, setUserInput] = useState([])
   const [showHint, setShowHint] = useState(false)
   const [isCorrect, setIsCorrect] = useState(null)
   const [completedCount, setCompletedCount] = useState(0)
   const [availableSentences, setAvailableSentences] = useState([])
+  const [learnedCount, setLearnedCount] = useState(0)
+  const [loading, setLoading] = useState(true)
 
-  // 预设的句子模板（使用常见汉字）
-  const sentenceTemplates = [
-    { sentence: '今天天气很好', words: ['今', '天', '气', '很', '好'] },
-    { sentence: '我爱学习汉字', words: ['我', '爱', '学', '习', '汉', '字'] },
-    { sentence: '太阳从东方升起', words: ['太', '阳', '从', '东', '方', '升', '起'] },
-    { sentence: '小鸟在天上飞', words: ['小', '鸟', '在', '天', '上', '飞'] },
-    { sentence: '我喜欢读书', words: ['我', '喜', '欢', '读', '书'] },
-    { sentence: '月亮很圆很亮', words: ['月', '亮', '很', '圆', '亮'] },
-    { sentence: '花儿开得很美', words: ['花', '儿', '开', '得', '很', '美'] },
-    { sentence: '水从山上流下来', words: ['水', '从', '山', '上', '流', '下', '来'] },
-    { sentence: '我爱我的家', words: ['我', '爱', '我', '的', '家'] },
-    { sentence: '星星在夜空闪烁', words: ['星', '在', '夜', '空', '闪', '烁'] },
-    { sentence: '春天来了很温暖', words: ['春', '天', '来', '了', '很', '温', '暖'] },
-    { sentence: '大树长得很高', words: ['大', '树', '长', '得', '很', '高'] },
-    { sentence: '小朋友在玩耍', words: ['小', '朋', '友', '在', '玩', '耍'] },
-    { sentence: '妈妈给我做饭', words: ['妈', '给', '我', '做', '饭'] },
-    { sentence: '风吹树叶沙沙响', words: ['风', '吹', '树', '叶', '沙', '响'] },
-  ]
-
-  // 根据已学汉字筛选可用的句子
+  // 由后端按已学汉字筛选句子（每个字都学过的句子才出题）
   useEffect(() => {
-    const learnedWords = words.filter(w => w.learned).map(w => w.word)
-    
-    if (learnedWords.length === 0) {
-      setAvailableSentences([])
-      return
+    loadSentences()
+  }, [])
+
+  const loadSentences = async () => {
+    try {
+      const data = await sentenceAPI.getAvailable()
+      setLearnedCount(data.learnedCount)
+      setAvailableSentences(data.items)
+    } catch (error) {
+      console.error('加载练习句子失败:', error)
+    } finally {
+      setLoading(false)
     }
-
-    // 计算已学汉字的总数
-    const totalLearnedChars = learnedWords.length
-
-    // 找出至少包含3个已学汉字的句子
-    const available = sentenceTemplates.filter(template => {
-      const matchedWords = template.words.filter(w => learnedWords.includes(w))
-      return matchedWords.length >= Math.min(3, template.words.length)
-    })
-
-    setAvailableSentences(available)
     setCurrentSentenceIndex(0)
     setUserInput([])
     setIsCorrect(null)
-  }, [words])
+  }
 
   const currentSentence = availableSentences[currentSentenceIndex]
 
+  // 备选汉字：本题的字加上其他句子里的字作干扰项，打乱顺序（换题时才重新打乱）
+  const shuffledChars = useMemo(() => {
+    if (!currentSentence) return []
+    const chars = new Set(currentSentence.chars)
+    for (const item of availableSentences) {
+      if (chars.size >= currentSentence.chars.length + DISTRACTOR_COUNT) break
+      item.chars.forEach(char => chars.add(char))
+    }
+    return [...chars].sort(() => Math.random() - 0.5)
+  }, [availableSentences, currentSentence])
+
   const handleCharClick = (char) => {
     if (isCorrect !== null) return // 已经检查过答案，不能再选择
 
@@ -96,7 +90,13 @@ const SentencePractice = ({ words }) => {
     setShowHint(false)
   }
 
-  const learnedCount = words.filter(w => w.learned).length
+  if (loading) {
+    return (
+      <div className="bg-white rounded-3xl p-12 shadow-lg text-center">
+        <p className="text-xl text-gray-500">加载中...</p>
+      </div>
+    )
+  }
 
   if (learnedCount === 0) {
     return (
@@ -143,14 +143,6 @@ const SentencePractice = ({ words }) => {
     )
   }
 
-  // 获取已学过的汉字作为选项
-  const learnedChars = words.filter(w => w.learned).map(w => ({
-    word: w.word,
-    pinyin: w.pinyin
-  }))
-
-  // 打乱汉字顺序（为了增加难度）
-  const shuffledChars = [...learnedChars].sort(() => Math.random() - 0.5)
 
   return (
     <div className="space-y-6">
@@ -292,15 +284,12 @@ const SentencePractice = ({ words }) => {
             {shuffledChars.map((char, index) => (
               <button
                 key={index}
-                onClick={() => handleCharClick(char.word)}
+                onClick={() => handleCharClick(char)}
                 disabled={isCorrect !== null}
                 className="bg-gradient-to-br from-purple-100 to-pink-100 hover:from-purple-200 hover:to-pink-200 rounded-xl p-4 text-center shadow-md hover:shadow-xl transition-all hover:scale-110 active:scale-95 disabled:opacity-50 disabled:cursor-not-allowed bounce-in"
                 style={{ animationDelay: `${index * 0.02}s` }}
               >
-                <div className="text-4xl font-bold text-purple-700">{char.word}</div>
-                {char.pinyin && (
-                  <div className="text-xs text-gray-600 mt-1">{char.pinyin}</div>
-                )}
+                <div className="text-4xl font-bold text-purple-700">{char}</div>
               </button>
             ))}
           </div>
@@ -1,19 +1,40 @@
 import React, { useState, useEffect } from 'react'
 import { TrendingUp, Star, Award, BookOpen, PenTool, CheckSquare } from 'lucide-react'
+import { withQuery } from '../services/api'
+
+// 统计周期：天数和后端汇总粒度
+const PERIODS = {
+  7: { label: '最近7天', bucket: 'day' },
+  30: { label: '最近30天', bucket: 'day' },
+  365: { label: '最近一年', bucket: 'week' }
+}
+
+// 本地日期格式化为 YYYY-MM-DD
+const formatDate = (date) => {
+  const pad = (n) => String(n).padStart(2, '0')
+  return `${date.getFullYear()}-${pad(date.getMonth() + 1)}-${pad(date.getDate())}`
+}
 
 const StarsChart = () => {
   const [data, setData] = useState([])
   const [loading, setLoading] = useState(true)
-  const [period, setPeriod] = useState(7) // 7天或30天
+  const [period, setPeriod] = useState(7) // 7天、30天或一年
 
   useEffect(() => {
     loadStats()
-  }, [])
+  }, [period])
 
   const loadStats = async () => {
     try {
       setLoading(true)
-      const response = await fetch('/api/stars/daily-stats')
+      const to = new Date()
+      const from = new Date()
+      from.setDate(to.getDate() - period + 1)
+      const response = await fetch(withQuery('/api/stars/daily-stats', {
+        from: formatDate(from),
+        to: formatDate(to),
+        bucket: PERIODS[period].bucket
+      }))
       const result = await response.json()
       setData(result)
     } catch (err) {
@@ -32,8 +53,8 @@ const StarsChart = () => {
     )
   }
 
-  // 根据period筛选数据
-  const displayData = period === 7 ? data.slice(-7) : data
+  // 后端已按所选周期返回数据
+  const displayData = data
 
   // 计算最大值用于比例
   const maxValue = Math.max(...displayData.map(d => d.total), 10)
@@ -59,26 +80,19 @@ const StarsChart = () => {
             </div>
           </div>
           <div className="flex gap-2">
-            <button
-              onClick={() => setPeriod(7)}
-              className={`px-4 py-2 rounded-xl font-bold transition-all ${
-                period === 7
-                  ? 'bg-white text-orange-600'
-                  : 'bg-white bg-opacity-20 text-white hover:bg-opacity-30'
-              }`}
-            >
-              最近7天
-            </button>
-            <button
-              onClick={() => setPeriod(30)}
-              className={`px-4 py-2 rounded-xl font-bold transition-all ${
-                period === 30
-                  ? 'bg-white text-orange-600'
-                  : 'bg-white bg-opacity-20 text-white hover:bg-opacity-30'
-              }`}
-            >
-              最近30天
-            </button>
+            {Object.entries(PERIODS).map(([days, { label }]) => (
+              <button
+                key={days}
+                onClick={() => setPeriod(Number(days))}
+                className={`px-4 py-2 rounded-xl font-bold transition-all ${
+                  period === Number(days)
+                    ? 'bg-white text-orange-600'
+                    : 'bg-white bg-opacity-20 text-white hover:bg-opacity-30'
+                }`}
+              >
+                {label}
+              </button>
+            ))}
           </div>
         </div>
       </div>
@@ -117,7 +131,9 @@ const StarsChart = () => {
 
       {/* 柱状图 */}
       <div className="bg-white rounded-3xl p-8 shadow-lg">
-        <h3 className="text-2xl font-bold text-gray-800 mb-6">每日获取趋势</h3>
+        <h3 className="text-2xl font-bold text-gray-800 mb-6">
+          {PERIODS[period].bucket === 'week' ? '每周获取趋势' : '每日获取趋势'}
+        </h3>
         
         {displayData.length === 0 ? (
           <div className="text-center py-12">
@@ -1,14 +1,12 @@
 import React, { useState, useEffect } from 'react'
 import { MapPin, Users, Calendar, Award } from 'lucide-react'
 
-const TravelFootprintMap = () => {
+const TravelFootprintMap = ({ stars = 0 }) => {
   const [plans, setPlans] = useState([])
   const [loading, setLoading] = useState(true)
-  const [totalStars, setTotalStars] = useState(0)
 
   useEffect(() => {
     loadPlans()
-    loadStars()
   }, [])
 
   const loadPlans = async () => {
@@ -25,16 +23,6 @@ const TravelFootprintMap = () => {
     }
   }
 
-  const loadStars = async () => {
-    try {
-      const response = await fetch('/api/stars')
-      const data = await response.json()
-      setTotalStars(data.stars || 0)
-    } catch (err) {
-      console.error('加载星星总数失败:', err)
-    }
-  }
-
   // 计算总统计
   const totalDestinations = plans.length
   const totalExpense = plans.reduce((sum, p) => sum + (p.totalExpense || 0), 0)
@@ -232,7 +220,7 @@ const TravelFootprintMap = () => {
             <div className="bg-white bg-opacity-20 rounded-xl p-4">
               <div className="text-3xl mb-2">⭐</div>
               <div className="font-bold text-lg">星星收集者</div>
-              <div className="text-sm opacity-90">获得 {totalStars} 颗星星</div>
+              <div className="text-sm opacity-90">获得 {stars} 颗星星</div>
             </div>
           </div>
         </div>
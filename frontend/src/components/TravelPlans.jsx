@@ -3,6 +3,7 @@ import { Plane, MapPin, DollarSign, Calendar, Plus, Trash2, Edit2, Star, CheckCi
 
 const TravelPlans = () => {
   const [plans, setPlans] = useState([])
+  const [summary, setSummary] = useState(null)
   const [footprints, setFootprints] = useState({})
   const [loading, setLoading] = useState(true)
   const [showAddForm, setShowAddForm] = useState(false)
@@ -28,9 +29,13 @@ const TravelPlans = () => {
   const loadPlans = async () => {
     try {
       setLoading(true)
-      const response = await fetch('/api/travel-plans')
+      const [response, summaryResponse] = await Promise.all([
+        fetch('/api/travel-plans'),
+        fetch('/api/travel-plans/summary')
+      ])
       const data = await response.json()
       setPlans(data)
+      setSummary(await summaryResponse.json())
     } catch (err) {
       console.error('加载旅行计划失败:', err)
     } finally {
@@ -182,6 +187,12 @@ const TravelPlans = () => {
             <div>
               <h2 className="text-2xl font-bold">旅行计划</h2>
               <p className="text-sm opacity-90">记录你的旅行梦想 ✈️</p>
+              {summary && summary.planCount > 0 && (
+                <p className="text-sm opacity-90 mt-1">
+                  总预算 ¥{summary.totalBudget} · 已花费 ¥{summary.totalExpense}
+                  {summary.overBudgetCount > 0 && ` · ${summary.overBudgetCount} 个计划超支`}
+                </p>
+              )}
             </div>
           </div>
           <button
@@ -2,11 +2,16 @@ import React, { useState, useEffect } from 'react'
 import { Calendar, TrendingUp, ChevronDown, ChevronUp } from 'lucide-react'
 import { weeklyAPI } from '../services/api'
 
+// 历史周统计展示的周数
+const WEEKS_WINDOW = 52
+
 const WeeklyStats = () => {
   const [weeklyStats, setWeeklyStats] = useState([])
   const [currentWeek, setCurrentWeek] = useState(null)
   const [loading, setLoading] = useState(true)
   const [expandedWeek, setExpandedWeek] = useState(null)
+  // 按周缓存的汉字明细（展开时再加载）
+  const [weekWords, setWeekWords] = useState({})
 
   useEffect(() => {
     loadWeeklyStats()
@@ -16,10 +21,10 @@ const WeeklyStats = () => {
     try {
       setLoading(true)
       const [stats, current] = await Promise.all([
-        weeklyAPI.getStats(),
+        weeklyAPI.getStats({ weeks: WEEKS_WINDOW, detail: 0 }),
         weeklyAPI.getCurrentWeek()
       ])
-      // 后端API现在返回包含words的完整数据
+      // 只取汇总，汉字明细展开时按周加载
       setWeeklyStats(stats)
       setCurrentWeek(current)
     } catch (err) {
@@ -29,12 +34,20 @@ const WeeklyStats = () => {
     }
   }
 
-  const toggleWeek = (year, week) => {
+  const toggleWeek = async (year, week) => {
     const key = `${year}-${week}`
     if (expandedWeek === key) {
       setExpandedWeek(null)
-    } else {
-      setExpandedWeek(key)
+      return
+    }
+    setExpandedWeek(key)
+    if (!weekWords[key]) {
+      try {
+        const detail = await weeklyAPI.getWords(year, week)
+        setWeekWords(prev => ({ ...prev, [key]: detail.words }))
+      } catch (err) {
+        console.error('加载周汉字失败:', err)
+      }
     }
   }
 
@@ -89,6 +102,7 @@ const WeeklyStats = () => {
             {weeklyStats.map((stat, index) => {
               const bgColor = colors[index % colors.length]
               const isExpanded = expandedWeek === `${stat.year}-${stat.week}`
+              const words = weekWords[`${stat.year}-${stat.week}`]
               
               return (
                 <div key={`${stat.year}-${stat.week}`} className="bounce-in" style={{ animationDelay: `${index * 0.05}s` }}>
@@ -114,13 +128,13 @@ const WeeklyStats = () => {
                   </button>
 
                   {/* 展开的汉字列表 */}
-                  {isExpanded && stat.words && stat.words.length > 0 && (
+                  {isExpanded && words && words.length > 0 && (
                     <div className="mt-4 bg-gray-50 rounded-2xl p-6 bounce-in">
                       <h3 className="text-xl font-bold text-gray-800 mb-4">
-                        📝 本周学习的汉字（{stat.words.length}个）
+                        📝 本周学习的汉字（{words.length}个）
                       </h3>
                       <div className="grid grid-cols-2 md:grid-cols-4 lg:grid-cols-6 gap-4">
-                        {stat.words.map((word, wordIndex) => (
+                        {words.map((word, wordIndex) => (
                           <div 
                             key={word.id}
                             className={`${bgColor} rounded-xl p-4 text-center shadow-md text-white bounce-in hover:scale-105 transition-transform`}
@@ -1,11 +1,59 @@
-import React, { useState } from 'react'
+import React, { useState, useEffect } from 'react'
 import { Plus, Trash2, Edit2, Check, X } from 'lucide-react'
+import { wordAPI } from '../services/api'
 
-const WordLibrary = ({ words, addWord, deleteWord, editWord }) => {
+const PAGE_SIZE = 30
+
+const WordLibrary = ({ addWord, deleteWord, editWord }) => {
   const [showAddForm, setShowAddForm] = useState(false)
   const [editingId, setEditingId] = useState(null)
   const [formData, setFormData] = useState({ word: '', pinyin: '', meaning: '' })
   const [loading, setLoading] = useState(false)
+  // 分页列表状态（只加载当前展示的页）
+  const [words, setWords] = useState([])
+  const [total, setTotal] = useState(0)
+  const [nextCursor, setNextCursor] = useState(null)
+  const [filter, setFilter] = useState('all')
+  const [search, setSearch] = useState('')
+  const [listLoading, setListLoading] = useState(false)
+  // 添加时汉字库中已有的同字条目（提示可能重复）
+  const [existingWords, setExistingWords] = useState([])
+
+  useEffect(() => {
+    loadWords(true)
+  }, [filter, search])
+
+  useEffect(() => {
+    const word = formData.word.trim()
+    if (editingId || !word) {
+      setExistingWords([])
+      return
+    }
+    wordAPI.suggest(word)
+      .then(items => setExistingWords(items.filter(w => w.word === word)))
+      .catch(() => setExistingWords([]))
+  }, [formData.word, editingId])
+
+  const loadWords = async (reset = false) => {
+    setListLoading(true)
+    try {
+      const data = await wordAPI.getPage({
+        limit: PAGE_SIZE,
+        cursor: reset ? null : nextCursor,
+        learned: filter === 'all' ? null : (filter === 'learned' ? 1 : 0),
+        q: search.trim()
+      })
+      setWords(reset ? data.items : [...words, ...data.items])
+      setNextCursor(data.nextCursor)
+      if (reset) {
+        setTotal(data.total)
+      }
+    } catch (err) {
+      console.error('加载汉字失败:', err)
+    } finally {
+      setListLoading(false)
+    }
+  }
 
   const handleSubmit = async (e) => {
     e.preventDefault()
@@ -14,10 +62,13 @@ const WordLibrary = ({ words, addWord, deleteWord, editWord }) => {
       setLoading(true)
       try {
         if (editingId) {
-          await editWord(editingId, formData)
+          const updated = await editWord(editingId, formData)
+          setWords(words.map(w => w.id === editingId ? updated : w))
           setEditingId(null)
         } else {
-          await addWord(formData)
+          const newWord = await addWord(formData)
+          setWords([newWord, ...words])
+          setTotal(total + 1)
         }
         setFormData({ word: '', pinyin: '', meaning: '' })
         setShowAddForm(false)
@@ -45,6 +96,8 @@ const WordLibrary = ({ words, addWord, deleteWord, editWord }) => {
     if (window.confirm(`确定要删除"${word.word}"吗？`)) {
       try {
         await deleteWord(word.id)
+        setWords(words.filter(w => w.id !== word.id))
+        setTotal(total - 1)
       } catch (err) {
         // 错误已在父组件处理
       }
@@ -85,6 +138,12 @@ const WordLibrary = ({ words, addWord, deleteWord, editWord }) => {
                 required
                 disabled={loading}
               />
+              {existingWords.length > 0 && (
+                <p className="mt-2 text-orange-600 font-bold">
+                  汉字库中已有：{existingWords.map(w => `${w.word}${w.pinyin ? `（${w.pinyin}）` : ''}`).join('、')}
+                  ，读音不同的多音字仍可添加
+                </p>
+              )}
             </div>
             <div>
               <label className="block text-xl font-bold text-gray-700 mb-2">
@@ -137,7 +196,25 @@ const WordLibrary = ({ words, addWord, deleteWord, editWord }) => {
 
       {/* 汉字列表 */}
       <div className="bg-white rounded-3xl p-8 shadow-lg">
-        <h2 className="text-2xl font-bold text-gray-800 mb-6">汉字库 ({words.length}个)</h2>
+        <h2 className="text-2xl font-bold text-gray-800 mb-6">汉字库 ({total}个)</h2>
+        <div className="flex flex-wrap gap-3 mb-6">
+          <input
+            type="text"
+            value={search}
+            onChange={(e) => setSearch(e.target.value)}
+            className="flex-1 min-w-[12rem] text-lg px-4 py-2 border-2 border-purple-200 rounded-xl focus:border-purple-500 focus:outline-none"
+            placeholder="搜索汉字或拼音"
+          />
+          {[['all', '全部'], ['learned', '已学会'], ['unlearned', '未学会']].map(([key, label]) => (
+            <button
+              key={key}
+              onClick={() => setFilter(key)}
+              className={`px-4 py-2 rounded-xl font-bold transition-all ${filter === key ? 'bg-purple-500 text-white' : 'bg-gray-100 text-gray-600 hover:bg-gray-200'}`}
+            >
+              {label}
+            </button>
+          ))}
+        </div>
         {words.length === 0 ? (
           <div className="text-center py-12">
             <p className="text-2xl text-gray-400">还没有添加任何汉字！</p>
@@ -184,6 +261,17 @@ const WordLibrary = ({ words, addWord, deleteWord, editWord }) => {
             })}
           </div>
         )}
+        {nextCursor && (
+          <div className="flex justify-center mt-6">
+            <button
+              onClick={() => loadWords(false)}
+              disabled={listLoading}
+              className="bg-gradient-to-r from-purple-500 to-pink-500 text-white px-8 py-3 rounded-2xl font-bold text-lg shadow-lg hover:shadow-xl transition-all hover:scale-105 active:scale-95 disabled:opacity-50"
+            >
+              {listLoading ? '加载中...' : '加载更多'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   )
@@ -5,10 +5,15 @@ export const API_ENDPOINTS = {
   // 汉字管理
   words: `${API_BASE_URL}/words`,
   word: (id) => `${API_BASE_URL}/words/${id}`,
+  suggestWords: `${API_BASE_URL}/words/suggest`,
   
   // 学习记录
   learn: (id) => `${API_BASE_URL}/learn/${id}`,
   
+  // 复习计划
+  reviewDue: `${API_BASE_URL}/review/due`,
+  review: (id) => `${API_BASE_URL}/review/${id}`,
+  
   // 星星管理
   stars: `${API_BASE_URL}/stars`,
   resetStars: `${API_BASE_URL}/stars/reset`,
@@ -39,6 +44,11 @@ export const API_ENDPOINTS = {
   poem: (id) => `${API_BASE_URL}/poems/${id}`,
   completePoem: (id) => `${API_BASE_URL}/poems/${id}/complete`,
   
+  // 句子练习
+  sentences: `${API_BASE_URL}/sentences`,
+  sentence: (id) => `${API_BASE_URL}/sentences/${id}`,
+  availableSentences: `${API_BASE_URL}/sentences/available`,
+  
   // 日常任务
   dailyTasks: `${API_BASE_URL}/daily-tasks`,
   dailyTask: (id) => `${API_BASE_URL}/daily-tasks/${id}`,
@@ -55,6 +65,12 @@ export const API_ENDPOINTS = {
   cancelRedemption: (id) => `${API_BASE_URL}/star-redemptions/${id}/cancel`,
   redemptionStats: `${API_BASE_URL}/star-redemptions/stats`,
   
+  // 首页看板
+  dashboard: `${API_BASE_URL}/dashboard`,
+  
+  // 实时事件（SSE）
+  events: `${API_BASE_URL}/events`,
+  
   // 健康检查
   health: `${API_BASE_URL}/health`,
 };
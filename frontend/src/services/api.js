@@ -22,10 +22,25 @@ async function fetchAPI(url, options = {}) {
   }
 }
 
+// 拼接查询参数（忽略空值）
+export function withQuery(url, params = {}) {
+  const search = new URLSearchParams()
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== '') {
+      search.append(key, value)
+    }
+  })
+  const query = search.toString()
+  return query ? `${url}?${query}` : url
+}
+
 // 汉字相关API
 export const wordAPI = {
-  // 获取所有汉字
-  getAll: () => fetchAPI(API_ENDPOINTS.words),
+  // 分页获取汉字 { limit, cursor, learned, q } -> { items, nextCursor, hasMore, total? }
+  getPage: (params) => fetchAPI(withQuery(API_ENDPOINTS.words, params)),
+  
+  // 联想：汉字前缀或不带声调的拼音前缀
+  suggest: (prefix) => fetchAPI(withQuery(API_ENDPOINTS.suggestWords, { prefix })),
   
   // 添加汉字
   add: (word) => fetchAPI(API_ENDPOINTS.words, {
@@ -51,6 +66,15 @@ export const learningAPI = {
   markAsLearned: (wordId) => fetchAPI(API_ENDPOINTS.learn(wordId), {
     method: 'POST',
   }),
+  
+  // 今天需要复习的汉字 -> { items, hasMore }
+  getDueReviews: (limit) => fetchAPI(withQuery(API_ENDPOINTS.reviewDue, { limit })),
+  
+  // 提交复习结果（quality 0-5，≥3 表示记住了）-> { stars, reviewInterval, nextReviewAt }
+  review: (wordId, quality) => fetchAPI(API_ENDPOINTS.review(wordId), {
+    method: 'POST',
+    body: JSON.stringify({ quality }),
+  }),
 };
 
 // 星星API
@@ -64,10 +88,32 @@ export const starAPI = {
   }),
 };
 
+// 首页看板API
+export const dashboardAPI = {
+  // 看板汇总 { stars, words, recentWords, currentWeek, reading, poems, redemptions }
+  get: () => fetchAPI(API_ENDPOINTS.dashboard),
+};
+
+// 实时事件API
+export const eventsAPI = {
+  // 订阅事件流，返回取消订阅函数；断线后浏览器自动带 Last-Event-ID 重连补发
+  subscribe: (onEvent) => {
+    const source = new EventSource(API_ENDPOINTS.events);
+    source.onmessage = (e) => {
+      try {
+        onEvent(JSON.parse(e.data));
+      } catch (error) {
+        console.error('事件解析失败:', error);
+      }
+    };
+    return () => source.close();
+  },
+};
+
 // 周统计API
 export const weeklyAPI = {
-  // 获取所有周统计
-  getStats: () => fetchAPI(API_ENDPOINTS.weeklyStats),
+  // 获取周统计 { weeks, detail }
+  getStats: (params) => fetchAPI(withQuery(API_ENDPOINTS.weeklyStats, params)),
   
   // 获取指定周的汉字
   getWords: (year, week) => fetchAPI(API_ENDPOINTS.weeklyWords(year, week)),
@@ -121,3 +167,9 @@ export const readingAPI = {
   getStats: () => fetchAPI(API_ENDPOINTS.readingStats),
 };
 
+// 句子练习API
+export const sentenceAPI = {
+  // 已学汉字能组成的句子 -> { learnedCount, items: [{ id, sentence, chars, missing }] }
+  getAvailable: (maxMissing = 0) => fetchAPI(withQuery(API_ENDPOINTS.availableSentences, { maxMissing })),
+};
+
@@ -10,8 +10,18 @@ CREATE TABLE IF NOT EXISTS words (
     pinyin VARCHAR(50) NOT NULL COMMENT '拼音',
     meaning VARCHAR(200) NOT NULL COMMENT '意思',
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
+    learn_count INT DEFAULT 0 NOT NULL COMMENT '学习次数',
+    first_learned_at DATETIME COMMENT '首次学习时间',
+    last_learned_at DATETIME COMMENT '最近学习时间',
+    pinyin_key VARCHAR(50) CHARACTER SET ascii COLLATE ascii_bin COMMENT '拼音检索键（去声调）',
+    review_reps INT DEFAULT 0 NOT NULL COMMENT '连续记住次数',
+    review_interval INT DEFAULT 0 NOT NULL COMMENT '复习间隔（天）',
+    review_ease FLOAT DEFAULT 2.5 NOT NULL COMMENT '难度系数',
+    next_review_at DATETIME COMMENT '下次复习时间',
     INDEX idx_word (word),
-    INDEX idx_created_at (created_at)
+    INDEX idx_created_at (created_at),
+    INDEX idx_pinyin_key (pinyin_key),
+    INDEX idx_next_review_at (next_review_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='汉字表';
 
 -- 学习记录表
@@ -57,24 +67,25 @@ CREATE TABLE IF NOT EXISTS reading_records (
     completed_at DATETIME COMMENT '完成时间',
     notes TEXT COMMENT '阅读笔记',
     FOREIGN KEY (book_id) REFERENCES books(id) ON DELETE CASCADE,
-    INDEX idx_book_id (book_id),
+    UNIQUE INDEX uniq_book_id (book_id),
     INDEX idx_completed (is_completed),
     INDEX idx_started_at (started_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='阅读记录表';
 
 -- 插入默认星星记录
-INSERT INTO star_records (stars) VALUES (0);
+-- 星星余额只有一行，主键固定为 1（后端按 id = 1 读写）
+INSERT INTO star_records (id, stars) VALUES (1, 0);
 
 -- 插入默认汉字
-INSERT INTO words (word, pinyin, meaning) VALUES
-('日', 'rì', '太阳'),
-('月', 'yuè', '月亮'),
-('水', 'shuǐ', '液体'),
-('火', 'huǒ', '燃烧'),
-('山', 'shān', '高大的地形'),
-('木', 'mù', '树木'),
-('人', 'rén', '人类'),
-('口', 'kǒu', '嘴巴');
+INSERT INTO words (word, pinyin, pinyin_key, meaning) VALUES
+('日', 'rì', 'ri', '太阳'),
+('月', 'yuè', 'yue', '月亮'),
+('水', 'shuǐ', 'shui', '液体'),
+('火', 'huǒ', 'huo', '燃烧'),
+('山', 'shān', 'shan', '高大的地形'),
+('木', 'mù', 'mu', '树木'),
+('人', 'rén', 'ren', '人类'),
+('口', 'kǒu', 'kou', '嘴巴');
 
 -- 插入默认书籍
 INSERT INTO books (title, author, cover_color, total_pages, description) VALUES
@@ -95,6 +106,8 @@ CREATE TABLE IF NOT EXISTS travel_plans (
     is_completed BOOLEAN DEFAULT FALSE COMMENT '是否完成',
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
     completed_at DATETIME COMMENT '完成时间',
+    total_expense DECIMAL(10, 2) DEFAULT 0 NOT NULL COMMENT '已花费（足迹金额合计）',
+    footprint_count INT DEFAULT 0 NOT NULL COMMENT '足迹数',
     INDEX idx_destination (destination),
     INDEX idx_completed (is_completed),
     INDEX idx_created_at (created_at)
@@ -123,9 +136,20 @@ CREATE TABLE IF NOT EXISTS poems (
     completed_at DATETIME COMMENT '完成时间',
     INDEX idx_title (title),
     INDEX idx_completed (is_completed),
-    INDEX idx_created_at (created_at)
+    INDEX idx_created_at (created_at),
+    INDEX idx_completed_at (completed_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='古诗表';
 
+-- 古诗检索倒排索引（标题/作者/正文的单字和相邻两字，由后端随古诗增删改维护）
+CREATE TABLE IF NOT EXISTS poem_terms (
+    term VARCHAR(2) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL COMMENT '词元',
+    poem_id INT NOT NULL COMMENT '古诗ID',
+    weight INT NOT NULL COMMENT '字段加权词频',
+    PRIMARY KEY (term, poem_id),
+    INDEX idx_poem_id (poem_id),
+    FOREIGN KEY (poem_id) REFERENCES poems(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='古诗检索索引表';
+
 -- 日常任务表
 CREATE TABLE IF NOT EXISTS daily_tasks (
     id INT AUTO_INCREMENT PRIMARY KEY,
@@ -145,7 +169,7 @@ CREATE TABLE IF NOT EXISTS task_completions (
     notes TEXT COMMENT '备注',
     stars_earned INT DEFAULT 0 COMMENT '获得星星数',
     FOREIGN KEY (task_id) REFERENCES daily_tasks(id) ON DELETE CASCADE,
-    INDEX idx_task_id (task_id),
+    INDEX idx_task_completed (task_id, completed_at),
     INDEX idx_completed_at (completed_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='任务完成记录表';
 
@@ -173,10 +197,47 @@ CREATE TABLE IF NOT EXISTS star_redemptions (
     status VARCHAR(20) DEFAULT 'pending' COMMENT '状态：pending/completed/cancelled',
     FOREIGN KEY (item_id) REFERENCES reward_items(id) ON DELETE CASCADE,
     INDEX idx_item_id (item_id),
-    INDEX idx_status (status),
+    INDEX idx_status_redeemed_at (status, redeemed_at),
     INDEX idx_redeemed_at (redeemed_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='星星兑换记录表';
 
+-- 句子练习模板表
+CREATE TABLE IF NOT EXISTS sentence_templates (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    sentence VARCHAR(100) NOT NULL COMMENT '句子',
+    char_count INT NOT NULL COMMENT '不重复的汉字数',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
+    INDEX idx_sentence (sentence),
+    INDEX idx_created_at (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='句子练习模板表';
+
+-- 句子汉字倒排索引（汉字 -> 句子，与 poem_terms.term 一样按二进制排序规则逐字区分，由后端随模板增删维护）
+CREATE TABLE IF NOT EXISTS sentence_chars (
+    hanzi VARCHAR(1) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL COMMENT '汉字',
+    sentence_id INT NOT NULL COMMENT '句子ID',
+    PRIMARY KEY (hanzi, sentence_id),
+    INDEX idx_sentence_id (sentence_id),
+    FOREIGN KEY (sentence_id) REFERENCES sentence_templates(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='句子汉字索引表';
+
+-- 数据版本表（用作接口 ETag）
+CREATE TABLE IF NOT EXISTS data_versions (
+    name VARCHAR(50) PRIMARY KEY COMMENT '资源名称',
+    version BIGINT DEFAULT 0 NOT NULL COMMENT '版本号'
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='数据版本表';
+
+INSERT INTO data_versions (name, version) VALUES
+('words', 0), ('books', 0), ('poems', 0), ('reward_items', 0), ('travel_plans', 0);
+
+-- 动态事件表（/api/events 实时推送，定期清理）
+CREATE TABLE IF NOT EXISTS activity_events (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    event_type VARCHAR(30) NOT NULL COMMENT '事件类型',
+    payload TEXT NOT NULL COMMENT '事件内容（JSON）',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
+    INDEX idx_created_at (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='动态事件表';
+
 -- 插入默认奖励商品
 INSERT INTO reward_items (name, description, cost_stars, icon) VALUES
 ('去游乐园', '全家一起去游乐园玩一天', 100, '🎢'),
@@ -186,3 +247,37 @@ INSERT INTO reward_items (name, description, cost_stars, icon) VALUES
 ('买零食', '买一些喜欢的零食', 30, '🍬'),
 ('周末旅行', '周末去附近玩两天', 150, '✈️');
 
+-- 插入默认练习句子及其汉字索引
+INSERT INTO sentence_templates (id, sentence, char_count) VALUES
+(1, '今天天气很好', 5),
+(2, '我爱学习汉字', 6),
+(3, '太阳从东方升起', 7),
+(4, '小鸟在天上飞', 6),
+(5, '我喜欢读书', 5),
+(6, '月亮很圆很亮', 4),
+(7, '花儿开得很美', 6),
+(8, '水从山上流下来', 7),
+(9, '我爱我的家', 4),
+(10, '星星在夜空闪烁', 6),
+(11, '春天来了很温暖', 7),
+(12, '大树长得很高', 6),
+(13, '小朋友在玩耍', 6),
+(14, '妈妈给我做饭', 5),
+(15, '风吹树叶沙沙响', 6);
+
+INSERT INTO sentence_chars (hanzi, sentence_id) VALUES
+('今', 1), ('天', 1), ('气', 1), ('很', 1), ('好', 1),
+('我', 2), ('爱', 2), ('学', 2), ('习', 2), ('汉', 2), ('字', 2),
+('太', 3), ('阳', 3), ('从', 3), ('东', 3), ('方', 3), ('升', 3), ('起', 3),
+('小', 4), ('鸟', 4), ('在', 4), ('天', 4), ('上', 4), ('飞', 4),
+('我', 5), ('喜', 5), ('欢', 5), ('读', 5), ('书', 5),
+('月', 6), ('亮', 6), ('很', 6), ('圆', 6),
+('花', 7), ('儿', 7), ('开', 7), ('得', 7), ('很', 7), ('美', 7),
+('水', 8), ('从', 8), ('山', 8), ('上', 8), ('流', 8), ('下', 8), ('来', 8),
+('我', 9), ('爱', 9), ('的', 9), ('家', 9),
+('星', 10), ('在', 10), ('夜', 10), ('空', 10), ('闪', 10), ('烁', 10),
+('春', 11), ('天', 11), ('来', 11), ('了', 11), ('很', 11), ('温', 11), ('暖', 11),
+('大', 12), ('树', 12), ('长', 12), ('得', 12), ('很', 12), ('高', 12),
+('小', 13), ('朋', 13), ('友', 13), ('在', 13), ('玩', 13), ('耍', 13),
+('妈', 14), ('给', 14), ('我', 14), ('做', 14), ('饭', 14),
+('风', 15), ('吹', 15), ('树', 15), ('叶', 15), ('沙', 15), ('响', 15);
@@ -0,0 +1,459 @@
+-- ========================================
+-- 数据库增量更新脚本
+-- 版本: v1.3.0
+-- 日期: 2026-10-18
+-- 说明: 查询性能优化（汇总字段、索引）
+-- ========================================
+
+USE literacy_db;
+
+-- 检查版本管理表是否存在
+CREATE TABLE IF NOT EXISTS db_version (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    version VARCHAR(20) NOT NULL COMMENT '版本号',
+    description VARCHAR(500) COMMENT '更新说明',
+    applied_at DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT '应用时间',
+    INDEX idx_version (version)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='数据库版本管理表';
+
+-- 检查是否已应用此版本
+SET @version_exists = (SELECT COUNT(*) FROM db_version WHERE version = 'v1.3.0');
+
+-- 如果版本已存在，则退出
+SELECT
+    CASE
+        WHEN @version_exists > 0 THEN '⚠️  版本 v1.3.0 已经应用过，无需重复执行'
+        ELSE '✅ 开始应用版本 v1.3.0 的更新...'
+    END AS status;
+
+-- 仅在版本不存在时执行更新
+SET @apply_update = IF(@version_exists = 0, 1, 0);
+
+-- ========================================
+-- 1. 汉字学习汇总字段
+-- ========================================
+SET @sql1 = IF(@apply_update = 1,
+'ALTER TABLE words
+    ADD COLUMN learn_count INT DEFAULT 0 NOT NULL COMMENT ''学习次数'',
+    ADD COLUMN first_learned_at DATETIME COMMENT ''首次学习时间'',
+    ADD COLUMN last_learned_at DATETIME COMMENT ''最近学习时间''',
+'SELECT 1');
+
+PREPARE stmt1 FROM @sql1;
+EXECUTE stmt1;
+DEALLOCATE PREPARE stmt1;
+
+-- 根据已有学习记录回填汇总字段
+SET @sql1b = IF(@apply_update = 1,
+'UPDATE words w
+    JOIN (
+        SELECT word_id, COUNT(*) AS cnt, MIN(learned_at) AS first_at, MAX(learned_at) AS last_at
+        FROM learning_records
+        GROUP BY word_id
+    ) s ON s.word_id = w.id
+SET w.learn_count = s.cnt,
+    w.first_learned_at = s.first_at,
+    w.last_learned_at = s.last_at',
+'SELECT 1');
+
+PREPARE stmt1b FROM @sql1b;
+EXECUTE stmt1b;
+DEALLOCATE PREPARE stmt1b;
+
+-- ========================================
+-- 2. 古诗完成时间索引（星星统计按时间范围查询）
+-- ========================================
+SET @sql2 = IF(@apply_update = 1,
+'ALTER TABLE poems ADD INDEX idx_completed_at (completed_at)',
+'SELECT 1');
+
+PREPARE stmt2 FROM @sql2;
+EXECUTE stmt2;
+DEALLOCATE PREPARE stmt2;
+
+-- ========================================
+-- 3. 数据版本表（用作接口 ETag）
+-- ========================================
+SET @sql3 = IF(@apply_update = 1,
+'CREATE TABLE IF NOT EXISTS data_versions (
+    name VARCHAR(50) PRIMARY KEY COMMENT ''资源名称'',
+    version BIGINT DEFAULT 0 NOT NULL COMMENT ''版本号''
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT=''数据版本表''',
+'SELECT 1');
+
+PREPARE stmt3 FROM @sql3;
+EXECUTE stmt3;
+DEALLOCATE PREPARE stmt3;
+
+SET @sql3b = IF(@apply_update = 1,
+'INSERT IGNORE INTO data_versions (name, version) VALUES
+(''words'', 0), (''books'', 0), (''poems'', 0), (''reward_items'', 0), (''travel_plans'', 0)',
+'SELECT 1');
+
+PREPARE stmt3b FROM @sql3b;
+EXECUTE stmt3b;
+DEALLOCATE PREPARE stmt3b;
+
+-- ========================================
+-- 4. 动态事件表（/api/events 实时推送）
+-- ========================================
+SET @sql4 = IF(@apply_update = 1,
+'CREATE TABLE IF NOT EXISTS activity_events (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    event_type VARCHAR(30) NOT NULL COMMENT ''事件类型'',
+    payload TEXT NOT NULL COMMENT ''事件内容（JSON）'',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT ''创建时间'',
+    INDEX idx_created_at (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT=''动态事件表''',
+'SELECT 1');
+
+PREPARE stmt4 FROM @sql4;
+EXECUTE stmt4;
+DEALLOCATE PREPARE stmt4;
+
+-- ========================================
+-- 5. 古诗检索索引表（升级后执行 flask --app wsgi rebuild-search-index 为已有古诗建立索引）
+-- ========================================
+SET @sql5 = IF(@apply_update = 1,
+'CREATE TABLE IF NOT EXISTS poem_terms (
+    term VARCHAR(2) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL COMMENT ''词元'',
+    poem_id INT NOT NULL COMMENT ''古诗ID'',
+    weight INT NOT NULL COMMENT ''字段加权词频'',
+    PRIMARY KEY (term, poem_id),
+    INDEX idx_poem_id (poem_id),
+    FOREIGN KEY (poem_id) REFERENCES poems(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT=''古诗检索索引表''',
+'SELECT 1');
+
+PREPARE stmt5 FROM @sql5;
+EXECUTE stmt5;
+DEALLOCATE PREPARE stmt5;
+
+-- ========================================
+-- 6. 汉字拼音检索键（升级后执行 flask --app wsgi rebuild-search-index 回填已有汉字）
+-- ========================================
+SET @sql6 = IF(@apply_update = 1,
+'ALTER TABLE words
+    ADD COLUMN pinyin_key VARCHAR(50) CHARACTER SET ascii COLLATE ascii_bin COMMENT ''拼音检索键（去声调）'',
+    ADD INDEX idx_pinyin_key (pinyin_key)',
+'SELECT 1');
+
+PREPARE stmt6 FROM @sql6;
+EXECUTE stmt6;
+DEALLOCATE PREPARE stmt6;
+
+-- ========================================
+-- 7. 汉字复习计划（SM-2 间隔重复）
+-- ========================================
+SET @sql7 = IF(@apply_update = 1,
+'ALTER TABLE words
+    ADD COLUMN review_reps INT DEFAULT 0 NOT NULL COMMENT ''连续记住次数'',
+    ADD COLUMN review_interval INT DEFAULT 0 NOT NULL COMMENT ''复习间隔（天）'',
+    ADD COLUMN review_ease FLOAT DEFAULT 2.5 NOT NULL COMMENT ''难度系数'',
+    ADD COLUMN next_review_at DATETIME COMMENT ''下次复习时间'',
+    ADD INDEX idx_next_review_at (next_review_at)',
+'SELECT 1');
+
+PREPARE stmt7 FROM @sql7;
+EXECUTE stmt7;
+DEALLOCATE PREPARE stmt7;
+
+-- 已学过的汉字从第一次复习开始排期
+SET @sql7b = IF(@apply_update = 1,
+'UPDATE words
+SET review_reps = 1,
+    review_interval = 1,
+    next_review_at = DATE_ADD(last_learned_at, INTERVAL 1 DAY)
+WHERE learn_count > 0',
+'SELECT 1');
+
+PREPARE stmt7b FROM @sql7b;
+EXECUTE stmt7b;
+DEALLOCATE PREPARE stmt7b;
+
+-- ========================================
+-- 8. 句子练习模板及汉字索引（GET /api/sentences/available）
+-- ========================================
+SET @sql8 = IF(@apply_update = 1,
+'CREATE TABLE IF NOT EXISTS sentence_templates (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    sentence VARCHAR(100) NOT NULL COMMENT ''句子'',
+    char_count INT NOT NULL COMMENT ''不重复的汉字数'',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT ''创建时间'',
+    INDEX idx_sentence (sentence),
+    INDEX idx_created_at (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT=''句子练习模板表''',
+'SELECT 1');
+
+PREPARE stmt8 FROM @sql8;
+EXECUTE stmt8;
+DEALLOCATE PREPARE stmt8;
+
+SET @sql8b = IF(@apply_update = 1,
+'CREATE TABLE IF NOT EXISTS sentence_chars (
+    hanzi VARCHAR(1) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL COMMENT ''汉字'',
+    sentence_id INT NOT NULL COMMENT ''句子ID'',
+    PRIMARY KEY (hanzi, sentence_id),
+    INDEX idx_sentence_id (sentence_id),
+    FOREIGN KEY (sentence_id) REFERENCES sentence_templates(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT=''句子汉字索引表''',
+'SELECT 1');
+
+PREPARE stmt8b FROM @sql8b;
+EXECUTE stmt8b;
+DEALLOCATE PREPARE stmt8b;
+
+-- 写入默认练习句子（原前端内置的句子）
+SET @sql8c = IF(@apply_update = 1,
+'INSERT IGNORE INTO sentence_templates (id, sentence, char_count) VALUES
+(1, ''今天天气很好'', 5),
+(2, ''我爱学习汉字'', 6),
+(3, ''太阳从东方升起'', 7),
+(4, ''小鸟在天上飞'', 6),
+(5, ''我喜欢读书'', 5),
+(6, ''月亮很圆很亮'', 4),
+(7, ''花儿开得很美'', 6),
+(8, ''水从山上流下来'', 7),
+(9, ''我爱我的家'', 4),
+(10, ''星星在夜空闪烁'', 6),
+(11, ''春天来了很温暖'', 7),
+(12, ''大树长得很高'', 6),
+(13, ''小朋友在玩耍'', 6),
+(14, ''妈妈给我做饭'', 5),
+(15, ''风吹树叶沙沙响'', 6)',
+'SELECT 1');
+
+PREPARE stmt8c FROM @sql8c;
+EXECUTE stmt8c;
+DEALLOCATE PREPARE stmt8c;
+
+SET @sql8d = IF(@apply_update = 1,
+'INSERT IGNORE INTO sentence_chars (hanzi, sentence_id) VALUES
+(''今'', 1), (''天'', 1), (''气'', 1), (''很'', 1), (''好'', 1),
+(''我'', 2), (''爱'', 2), (''学'', 2), (''习'', 2), (''汉'', 2), (''字'', 2),
+(''太'', 3), (''阳'', 3), (''从'', 3), (''东'', 3), (''方'', 3), (''升'', 3), (''起'', 3),
+(''小'', 4), (''鸟'', 4), (''在'', 4), (''天'', 4), (''上'', 4), (''飞'', 4),
+(''我'', 5), (''喜'', 5), (''欢'', 5), (''读'', 5), (''书'', 5),
+(''月'', 6), (''亮'', 6), (''很'', 6), (''圆'', 6),
+(''花'', 7), (''儿'', 7), (''开'', 7), (''得'', 7), (''很'', 7), (''美'', 7),
+(''水'', 8), (''从'', 8), (''山'', 8), (''上'', 8), (''流'', 8), (''下'', 8), (''来'', 8),
+(''我'', 9), (''爱'', 9), (''的'', 9), (''家'', 9),
+(''星'', 10), (''在'', 10), (''夜'', 10), (''空'', 10), (''闪'', 10), (''烁'', 10),
+(''春'', 11), (''天'', 11), (''来'', 11), (''了'', 11), (''很'', 11), (''温'', 11), (''暖'', 11),
+(''大'', 12), (''树'', 12), (''长'', 12), (''得'', 12), (''很'', 12), (''高'', 12),
+(''小'', 13), (''朋'', 13), (''友'', 13), (''在'', 13), (''玩'', 13), (''耍'', 13),
+(''妈'', 14), (''给'', 14), (''我'', 14), (''做'', 14), (''饭'', 14),
+(''风'', 15), (''吹'', 15), (''树'', 15), (''叶'', 15), (''沙'', 15), (''响'', 15)',
+'SELECT 1');
+
+PREPARE stmt8d FROM @sql8d;
+EXECUTE stmt8d;
+DEALLOCATE PREPARE stmt8d;
+
+-- ========================================
+-- 9. 旅行计划花费汇总字段
+-- ========================================
+SET @sql9 = IF(@apply_update = 1,
+'ALTER TABLE travel_plans
+    ADD COLUMN total_expense DECIMAL(10, 2) DEFAULT 0 NOT NULL COMMENT ''已花费（足迹金额合计）'',
+    ADD COLUMN footprint_count INT DEFAULT 0 NOT NULL COMMENT ''足迹数''',
+'SELECT 1');
+
+PREPARE stmt9 FROM @sql9;
+EXECUTE stmt9;
+DEALLOCATE PREPARE stmt9;
+
+-- 根据已有足迹回填汇总字段
+SET @sql9b = IF(@apply_update = 1,
+'UPDATE travel_plans p
+    JOIN (
+        SELECT plan_id, SUM(expense) AS total, COUNT(*) AS cnt
+        FROM travel_footprints
+        GROUP BY plan_id
+    ) s ON s.plan_id = p.id
+SET p.total_expense = s.total,
+    p.footprint_count = s.cnt',
+'SELECT 1');
+
+PREPARE stmt9b FROM @sql9b;
+EXECUTE stmt9b;
+DEALLOCATE PREPARE stmt9b;
+
+-- ========================================
+-- 10. 任务完成记录复合索引（任务看板分组统计，替代 idx_task_id）
+-- ========================================
+SET @sql10 = IF(@apply_update = 1,
+'ALTER TABLE task_completions
+    ADD INDEX idx_task_completed (task_id, completed_at),
+    DROP INDEX idx_task_id',
+'SELECT 1');
+
+PREPARE stmt10 FROM @sql10;
+EXECUTE stmt10;
+DEALLOCATE PREPARE stmt10;
+
+-- ========================================
+-- 11. 阅读记录按书籍唯一（阅读接口 upsert，替代 idx_book_id）
+-- ========================================
+-- 先清理重复记录：每本书保留已读完的、页数最多的、最新的一条
+SET @sql11 = IF(@apply_update = 1,
+'DELETE r FROM reading_records r
+    JOIN (
+        SELECT id FROM (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY book_id ORDER BY is_completed DESC, current_page DESC, id DESC
+            ) AS rn
+            FROM reading_records
+        ) ranked
+        WHERE rn > 1
+    ) d ON d.id = r.id',
+'SELECT 1');
+
+PREPARE stmt11 FROM @sql11;
+EXECUTE stmt11;
+DEALLOCATE PREPARE stmt11;
+
+SET @sql11b = IF(@apply_update = 1,
+'ALTER TABLE reading_records
+    ADD UNIQUE INDEX uniq_book_id (book_id),
+    DROP INDEX idx_book_id',
+'SELECT 1');
+
+PREPARE stmt11b FROM @sql11b;
+EXECUTE stmt11b;
+DEALLOCATE PREPARE stmt11b;
+
+-- ========================================
+-- 12. 兑换记录状态 + 时间复合索引（替代 idx_status）
+-- ========================================
+SET @sql12 = IF(@apply_update = 1,
+'ALTER TABLE star_redemptions
+    ADD INDEX idx_status_redeemed_at (status, redeemed_at),
+    DROP INDEX idx_status',
+'SELECT 1');
+
+PREPARE stmt12 FROM @sql12;
+EXECUTE stmt12;
+DEALLOCATE PREPARE stmt12;
+
+-- ========================================
+-- 13. 星星余额固定为主键 1 的单行（并发首次写入不再建出多行）
+-- ========================================
+-- 旧版本一直读取最早的一行：没有 id = 1 时把它改为 1，其余行删除，最后确保该行存在
+SET @sql13 = IF(@apply_update = 1,
+'UPDATE star_records SET id = 1
+    WHERE id = (SELECT min_id FROM (SELECT MIN(id) AS min_id FROM star_records) m)
+    AND NOT EXISTS (SELECT 1 FROM (SELECT id FROM star_records WHERE id = 1) s)',
+'SELECT 1');
+
+PREPARE stmt13 FROM @sql13;
+EXECUTE stmt13;
+DEALLOCATE PREPARE stmt13;
+
+SET @sql13b = IF(@apply_update = 1,
+'DELETE FROM star_records WHERE id <> 1',
+'SELECT 1');
+
+PREPARE stmt13b FROM @sql13b;
+EXECUTE stmt13b;
+DEALLOCATE PREPARE stmt13b;
+
+SET @sql13c = IF(@apply_update = 1,
+'INSERT IGNORE INTO star_records (id, stars) VALUES (1, 0)',
+'SELECT 1');
+
+PREPARE stmt13c FROM @sql13c;
+EXECUTE stmt13c;
+DEALLOCATE PREPARE stmt13c;
+
+-- ========================================
+-- 记录版本信息
+-- ========================================
+SET @sql_version = IF(@apply_update = 1,
+'INSERT INTO db_version (version, description) VALUES (''v1.3.0'', ''查询性能优化：汉字学习汇总字段、古诗完成时间索引、数据版本表、动态事件表、古诗检索索引、汉字拼音检索键、汉字复习计划、句子练习模板、旅行花费汇总、任务完成复合索引、阅读记录唯一索引、兑换记录复合索引、星星余额单行'')',
+'SELECT 1');
+
+PREPARE stmt_version FROM @sql_version;
+EXECUTE stmt_version;
+DEALLOCATE PREPARE stmt_version;
+
+-- ========================================
+-- 验证更新结果
+-- ========================================
+SELECT
+    CASE
+        WHEN @apply_update = 1 THEN '✅ 数据库升级完成！'
+        ELSE '⚠️  更新已跳过（版本已存在）'
+    END AS result;
+
+-- 显示当前数据库版本信息
+SELECT
+    version AS '版本号',
+    description AS '说明',
+    applied_at AS '应用时间'
+FROM db_version
+ORDER BY applied_at DESC
+LIMIT 5;
+
+-- ========================================
+-- 更新说明
+-- ========================================
+/*
+v1.3.0 更新内容：
+
+1. 汉字学习汇总字段（words.learn_count / first_learned_at / last_learned_at）
+   - 由学习、重置接口同步维护
+   - GET /api/words 不再逐字查询学习记录
+
+2. 古诗完成时间索引（poems.idx_completed_at）
+   - 星星统计按完成时间范围聚合
+
+3. 数据版本表（data_versions）
+   - 写接口递增对应资源版本号，读接口据此返回 ETag / 304
+
+4. 动态事件表（activity_events）
+   - 写接口同事务写入事件，GET /api/events 以 SSE 推送
+   - 超过 EVENTS_RETENTION_HOURS 的事件自动清理
+
+5. 古诗检索索引表（poem_terms）
+   - GET /api/poems/search 使用的 n-gram 倒排索引，由添加/修改/删除古诗接口同步维护
+   - 已有古诗需在升级后执行一次：docker compose exec backend flask --app wsgi rebuild-search-index
+
+6. 汉字拼音检索键（words.pinyin_key，idx_pinyin_key）
+   - 去声调、去空格的小写拼音（ü 记作 v），GET /api/words/suggest 按前缀联想，添加汉字时据此查重
+   - 已有汉字的检索键由同一个 rebuild-search-index 命令回填
+
+7. 汉字复习计划（words.review_reps / review_interval / review_ease / next_review_at，idx_next_review_at）
+   - SM-2 间隔重复，由学习、复习接口增量更新
+   - GET /api/review/due 直接按 next_review_at 索引取今天到期的汉字
+   - 已学过的汉字回填为学习后第二天复习
+
+8. 句子练习模板（sentence_templates）及汉字索引表（sentence_chars）
+   - 练习句子改为存库，可通过 /api/sentences 增删
+   - GET /api/sentences/available 按汉字索引找出已学汉字覆盖的句子
+   - 写入原前端内置的 15 个默认句子
+
+9. 旅行计划花费汇总字段（travel_plans.total_expense / footprint_count）
+   - 由添加、删除足迹接口同事务维护
+   - GET /api/travel-plans 不再逐计划 SUM 足迹；GET /api/travel-plans/summary 一次扫描计划表给出预算与花费汇总
+
+10. 任务完成记录复合索引（task_completions.idx_task_completed，替代 idx_task_id）
+   - GET /api/daily-tasks 一条分组查询给出每个任务的累计次数、最近完成时间和当天完成次数
+
+11. 阅读记录按书籍唯一（reading_records.uniq_book_id，替代 idx_book_id）
+   - 升级时先删除重复记录，每本书保留已读完的、页数最多的、最新的一条
+   - 开始/完成/进度接口用 INSERT ... ON DUPLICATE KEY UPDATE 取得记录，并发请求不再产生重复
+   - GET /api/books 与阅读记录左连接一次取出，GET /api/reading/stats 一条条件聚合
+
+12. 兑换记录状态 + 时间复合索引（star_redemptions.idx_status_redeemed_at，替代 idx_status）
+   - GET /api/star-redemptions 支持 ?status=、?from=&to= 过滤，商品随记录连接取出
+
+13. 星星余额单行（star_records 固定 id = 1）
+   - 保留原先一直被读取的最早一行并改为 id = 1，删除并发首次写入产生的多余行
+   - 增减余额按 id = 1 原子更新，余额行缺失时用 INSERT ... ON DUPLICATE KEY UPDATE 补建
+
+注意事项：
+- 此脚本可以安全地重复执行
+- 如果版本已存在，将自动跳过更新
+- 升级前请先备份数据库
+*/